@@ -12,6 +12,8 @@ import random
 import colorsys
 import numpy as np
 
+from recurrences import fibonacci_list
+
 # =======================
 # CONFIG / TUNABLES
 # =======================
@@ -52,10 +54,7 @@ def hsv_to_rgb(h, s, v):
     return colorsys.hsv_to_rgb(h % 1.0, s, v)
 
 def compute_fibonacci_list(n):
-    fib = [1, 1]
-    while len(fib) < n:
-        fib.append(fib[-1] + fib[-2])
-    return fib[:n]
+    return fibonacci_list(n, start=1)
 
 FIB_LIST = compute_fibonacci_list(FIB_COUNT)
 FIB_MAX = float(FIB_LIST[-1])
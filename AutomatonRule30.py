@@ -6,40 +6,59 @@ Created on Sun Jan 15 15:18:06 2023
 """
 import turtle
 
-# Initial state of the pattern, represented as a 32-bit binary number
-state = 1 << 31
-
-# Set up turtle graphics window with width and height of 800 pixels
-turtle.screensize(canvwidth=7680, canvheight=4800, bg='black')
-# Set turtle speed to be the fastest possible
-turtle.speed('fastest')
-turtle.color('red')
-# Pick the pen up and move turtle to starting position
-turtle.penup()
-turtle.setpos(0, 0)
-
-# Create an empty 2D array to store the pattern
-data = []
-
-# Iterate over 32 rows
-for i in range(32):
-    # Create an empty list for the current row
-    row = []
-    # Iterate over 64 columns
-    for j in range(64):
-        # Append 1 to the current row if the corresponding bit in state is 1, else append 0
-        row.append(1 if state >> j & 1 else 0)
-    # Append the current row to the data array
-    data.append(row)
-    # Update the state using bitwise operations
-    state = (state >> 1) ^ (state | state << 1)
-
-for i in range(36):
-    for j in range(64):
-        if data[i][j] == 1:
-            turtle.dot()
-        turtle.forward(10)
-    turtle.setpos(0, turtle.ycor() - 10)
-
-# Wait for a mouse click before exiting turtle graphics window
-turtle.exitonclick()
+from cellular_automaton import (ElementaryCA, SpaceTime, cell_runs, save_raster, single_cell_row, unpack_rows,
+                                write_spacetime)
+
+RULE = 30     # Elementary rule number
+WIDTH = 64    # Number of columns
+ROWS = 32     # Number of generations to draw
+SPACETIME_PATH = None        # Set to a file name to stream the run to disk instead of drawing it
+SPACETIME_GENERATIONS = 10 ** 7
+IMAGE_PATH = None            # Set to a .png or .pbm file name to write a 1-bit image instead of drawing
+IMAGE_SCALE = 1              # Pixels per cell in the image
+CELL_SIZE = 10               # Canvas pixels per cell in the interactive window
+
+def draw_runs(canvas, data, cell_size=CELL_SIZE, color='red'):
+    """Draws each horizontal run of live cells as a single canvas rectangle."""
+    half = cell_size / 2
+    for i, row in enumerate(data):
+        for start, stop in cell_runs(row).tolist():
+            canvas.create_rectangle(start * cell_size - half, i * cell_size - half,
+                                    (stop - 1) * cell_size + half, i * cell_size + half,
+                                    fill=color, outline='')
+
+def main():
+    # Initial state of the pattern: a single live cell at column 31
+    automaton = ElementaryCA(RULE, WIDTH, state=single_cell_row(WIDTH, 31))
+
+    # Research runs: stream every generation into a memory-mapped file
+    if SPACETIME_PATH is not None:
+        write_spacetime(SPACETIME_PATH, automaton, SPACETIME_GENERATIONS)
+        history = SpaceTime(SPACETIME_PATH)
+        print(f"Wrote {len(history)} generations of rule {history.rule} to {SPACETIME_PATH}")
+        return
+
+    # Packed rows for every generation to show
+    rows = next(automaton.iter_blocks(ROWS))
+
+    # Batch output: write the rows straight to a 1-bit image
+    if IMAGE_PATH is not None:
+        save_raster(IMAGE_PATH, rows, WIDTH, IMAGE_SCALE)
+        print(f"Wrote {ROWS} generations to {IMAGE_PATH}")
+        return
+
+    # Set up turtle graphics window
+    turtle.screensize(canvwidth=7680, canvheight=4800, bg='black')
+    turtle.hideturtle()
+
+    # Unpack the packed rows into a 2D array of 0/1 cells and draw them row by row,
+    # one rectangle per run of live cells (canvas y grows downwards like the rows)
+    data = unpack_rows(rows, WIDTH)
+    draw_runs(turtle.getcanvas(), data)
+    turtle.update()
+
+    # Wait for a mouse click before exiting turtle graphics window
+    turtle.exitonclick()
+
+if __name__ == '__main__':
+    main()
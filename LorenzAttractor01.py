@@ -5,8 +5,9 @@ Created on Tue Dec 27 02:24:01 2022
 @author: Juan Arce
 """
 import turtle
-import numpy as np
-from math import atan2
+
+from lorenz_integrator import iter_trajectory, lorenz3
+from lorenz_render import draw_polyline
 
 # Set the values of ρ, σ, and β
 rho = 28
@@ -14,30 +15,22 @@ sigma = 10
 beta = 8/3
 scale = 10
 dt = 0.01  # time step
+chunk = 500  # Segments drawn per screen update
 
 # Set the initial conditions
 x, y, z = 1.0, 1.0, 1.0
-dx, dy = 0.0, 0.0  # initialize the x velocity
+states = iter_trajectory(lorenz3, (x, y, z), dt, None, chunk, rho=rho, sigma=sigma, beta=beta)
 # Create a turtle and set the pen size
+screen = turtle.Screen()
 t = turtle.Turtle()
-t.speed('fastest')
+t.hideturtle()
 t.pensize(1)
 t.pencolor('red')
-t.radians()
 t.pendown()
 
-while True:
-    t.setpos(x*scale, y*scale)
-    t.setheading(atan2(dy, dx))
-    
-    # Solve the differential equations
-    dx = (sigma * (y - x)) * dt
-    dy = (x * (rho - z) - y) * dt
-    dz = (x * y - beta * z) * dt
-    
-    x += dx
-    y += dy
-    z += dz
+# Solve the differential equations chunk by chunk with RK4 and plot (x, y)
+for block in states:
+    draw_polyline(t, screen, block[:, :2] * scale, chunk=chunk)
 
 # Keep the window open until it is closed
 turtle.mainloop()
@@ -1,8 +1,9 @@
 import turtle
 import numpy as np
-from math import atan2
-from scipy.integrate import odeint
-turtle.screensize(canvwidth=7680, canvheight=4800, bg='black')
+
+from lorenz_integrator import TrajectoryCache, lorenz5
+from lorenz_render import draw_polyline, save_polyline, segment_colors
+
 # Set the values of ρ, σ, and β
 rho = 43.5
 sigma = 10.0
@@ -10,33 +11,39 @@ beta = 8.0 / 3.0
 d0 = 19.0 / 3.0
 scale = 10
 
-def f(state, t):
-    x, y, z, y1, z1 = state  # Unpack the state vector
-    return sigma * (y - x), x * (rho - z) - y, x * y - x * y1 - beta * z, x * z - 2 * x * z1 - d0 * y1, 2 * x * y1 - 4 * beta * z1  # Derivatives
-
+# The 5-dimensional system f(state, t) is lorenz_integrator.lorenz5
 state0 = [1.0, 1.0, 1.0, 1.0, 1.0]
-t = np.arange(0.0, 40.0, 0.01)
-
-states = odeint(f, state0, t)
-
-# Create a turtle and set the pen size
-t = turtle.Turtle()
-t.speed('fastest')
-t.pensize(1)
-t.pencolor('red')
-t.radians()
-t.pendown()
-
-i = 0
-while i < len(states):
-    x, y, z, y1, z1 = states[i]
-    t.setpos(x*scale, z*scale)
-    t.setheading(atan2(z1, y1))
-    
-    # Set the pen color to a random color
-    t.pencolor(np.random.rand(3))
-    
-    i += 1
-
-# Keep the window open until it is closed
-turtle.mainloop()
+dt = 0.01
+steps = 3999   # 4000 states over t = 0 .. 40, as np.arange(0.0, 40.0, 0.01)
+chunk = 500    # States integrated ahead of the drawing, and segments per screen update
+image_path = None  # Set to a .png file name to render headlessly instead of opening a window
+
+# Integrate lazily: drawing starts as soon as the first chunk is ready, and
+# a run with the same parameters reads the trajectory back from the cache
+states = TrajectoryCache().iter_chunks(lorenz5, state0, dt, steps, chunk, rho=rho, sigma=sigma, beta=beta, d0=d0)
+
+# A random pen color for every state, drawn in one call
+colors = segment_colors(steps + 1)
+
+if image_path is not None:
+    points = np.concatenate([block[:, [0, 2]] for block in states]) * scale
+    save_polyline(image_path, points, colors[1:])
+else:
+    turtle.screensize(canvwidth=7680, canvheight=4800, bg='black')
+    screen = turtle.Screen()
+
+    # Create a turtle and set the pen size
+    t = turtle.Turtle()
+    t.hideturtle()
+    t.pensize(1)
+    t.pencolor('red')
+    t.pendown()
+
+    # Plot (x, z), switching to the next random color after every state
+    start = 0
+    for block in states:
+        draw_polyline(t, screen, block[:, [0, 2]] * scale, colors[start:start + len(block)], chunk)
+        start += len(block)
+
+    # Keep the window open until it is closed
+    turtle.mainloop()
@@ -5,6 +5,10 @@ from turtle import *
 from random import randint
 import math
 
+from frame_batch import FrameBatch
+from path_cycle import PathCycle
+from recurrences import LinearRecurrence
+
 #number of sides
 n = 17
 #lenght of the sizes
@@ -21,16 +25,8 @@ colormode(255)
 skk.width(0)
 skk.goto(-150, -150)
 
-memo = {}
-def fibonacci(n):
-    if n in memo : 
-        return memo[n]
-    if n <= 2: 
-        f = 1
-    else: f =  fibonacci(n-3) + fibonacci(n-5)+ fibonacci(n-9) + fibonacci(n-7)
-
-    memo[n] = f 
-    return f
+# Custom Fibonacci-like recurrence, evaluated by companion-matrix powers
+fibonacci = LinearRecurrence((3, 5, 9, 7))
 
 def star1(fibonacci):
     for i in range(n):
@@ -44,5 +40,9 @@ def star2(fibonacci):
         skk.forward(fibonacci(n*s))
         skk.right(fibonacci(n+45))	
 
-while True: 
-    star1(fibonacci)  , star2(fibonacci) 
+# Once the path closes, keep recoloring its lines instead of retracing them
+cycle = PathCycle(skk)
+with FrameBatch(wn, skk):
+    while not cycle.mark(): 
+        star1(fibonacci)  , star2(fibonacci)
+cycle.replay(lambda: (randint(0, 255),randint(0, 255),randint(0, 255))) 
@@ -1,5 +1,10 @@
 #Arce Software/(The Ouroborus Cataphractus)/March 2022 Costa Rica | Juan Arce
 import turtle 
+
+from frame_batch import FrameBatch
+from path_cycle import PathCycle
+from recurrences import fibonacci
+
 #number of sides
 n = 13
 #lenght of the sizes
@@ -11,16 +16,6 @@ wn.title("Armadillo")
 skk = turtle.Turtle()
 skk.speed(0)
 
-def fibonacci(n):
-    fibo = []
-    for i in range(n): 
-        if i == 0 or i == 1:
-            fibo.append(i)
-        else:
-            f = fibo.append(fibo[i-1] + fibo[i-2])
-    fibo[n] = f 
-    return f
-
 def sprirograph(fibonacci):
     skk.goto(100 , -175)        
     for i in range(n):
@@ -43,5 +38,9 @@ def sprirograph(fibonacci):
                     skk.forward(l)
                     skk.left(n)
                 skk.left(l)
-while True: 
-    sprirograph(fibonacci)
+# The path closes after a few passes; later passes would only redraw it
+cycle = PathCycle(skk)
+with FrameBatch(wn, skk):
+    while not cycle.mark(): 
+        sprirograph(fibonacci)
+cycle.replay()
@@ -1,26 +1,13 @@
 import turtle
 from random import randint
-turtle.colormode(255)
-# Create Fibonacci Cache
-fibonacci_cache = {}
 
-def fibonacci(n):
-#If we have cached the valued, then return it 
-    if n in fibonacci_cache:
-        return fibonacci_cache[n]
-            
-# Compute the Nth term
-    if n == 1:
-        value = 1
-    elif n == 2:
-        value = 1
-    elif n > 2: 
-        value = fibonacci(n-1) + fibonacci(n-2)
-      
-# Cache the value and return it
-    fibonacci_cache[n] = value
-    return value
+from path_cycle import PathCycle
+from recurrences import fibonacci
+from square_spiral import square_spiral, square_spiral_end
+
+VIEWPORT = (-300, -250, 300, 250)  # The 600x500 window in turtle coordinates
 
+turtle.colormode(255)
 wn = turtle.Screen()
 wn.bgcolor("black")
 wn.title("Arce")
@@ -32,13 +19,24 @@ turtle.width()
 turtle.speed(200)
 
 def fib(fibonacci):
-    for i in range(fibonacci):
+    # Only the segments that cross the window are drawn; the rest of the spiral is skipped in closed form
+    start, heading = turtle.position(), turtle.heading()
+    for i, begin, end in square_spiral(fibonacci, VIEWPORT, start, heading):
+        turtle.penup()
+        turtle.goto(begin)
+        turtle.pendown()
         turtle.color(randint(0, 255), randint(0, 255), randint(0, 255))
-        turtle.forward(i)
-        turtle.right(90)
+        turtle.goto(end)
+    x, y, heading = square_spiral_end(fibonacci, start, heading)
+    turtle.penup()
+    turtle.goto(x, y)
+    turtle.setheading(heading)
+    turtle.pendown()
 
 
 
-while True: 
+# Consecutive spirals return to the starting point and heading after a few calls
+cycle = PathCycle(turtle.getturtle())
+while not cycle.mark(): 
         fib(fibonacci(50))
-turtle.exitonclick()
\ No newline at end of file
+cycle.replay(lambda: (randint(0, 255), randint(0, 255), randint(0, 255)))
\ No newline at end of file
@@ -0,0 +1,304 @@
+"""
+Bit-packed elementary cellular automaton engine.
+
+A row of `width` cells is stored as packed little-endian uint64 words: cell j
+is bit j % 64 of word j // 64, the same order as `state >> j & 1` in
+AutomatonRule30.py. Any elementary rule number (0-255) is stepped with
+word-parallel bit operations on whole words: the left and right neighbour
+rows are the row shifted by one bit with carries across word boundaries,
+and the rule is applied as a boolean expression of (left, center, right).
+
+Cells beyond the row are handled explicitly by the boundary mode:
+'fixed' treats them as dead cells, 'periodic' wraps the row into a ring.
+"""
+import numpy as np
+
+from raster import scale_image, write_pbm, write_png_bits
+
+WORD_BITS = 64
+BOUNDARIES = ('fixed', 'periodic')
+
+_ONE = np.uint64(1)
+_TOP = np.uint64(WORD_BITS - 1)
+_ALL = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+# --- Packing Helpers ---
+
+def words_for(width):
+    """Number of uint64 words needed for a row of `width` cells."""
+    return (width + WORD_BITS - 1) // WORD_BITS
+
+def tail_mask(width):
+    """Mask of the valid bits in the last word of a row."""
+    bits = width % WORD_BITS
+    return _ALL if bits == 0 else np.uint64((1 << bits) - 1)
+
+def pack_row(cells):
+    """Packs a sequence of 0/1 cells into uint64 words."""
+    cells = np.asarray(cells, dtype=np.uint8)
+    padded = np.zeros(words_for(len(cells)) * WORD_BITS, dtype=np.uint8)
+    padded[:len(cells)] = cells
+    return np.packbits(padded, bitorder='little').view('<u8').astype(np.uint64)
+
+def unpack_rows(words, width):
+    """Unpacks (..., words) uint64 rows into (..., width) uint8 cells."""
+    words = np.ascontiguousarray(words, dtype='<u8')
+    cells = np.unpackbits(words.view(np.uint8), axis=-1, bitorder='little')
+    return cells[..., :width]
+
+def single_cell_row(width, index=None):
+    """Packed row with one live cell, in the middle by default."""
+    row = np.zeros(words_for(width), dtype=np.uint64)
+    index = width // 2 if index is None else index
+    row[index // WORD_BITS] = _ONE << np.uint64(index % WORD_BITS)
+    return row
+
+def rule_terms(rule):
+    """Splits an elementary rule into the minterms to evaluate and whether to invert them.
+
+    The rule is the sum of its minterms (one per neighbourhood 4*l + 2*c + r
+    whose bit is set). Rules with more than four live minterms are built
+    from the dead ones and inverted, so at most four terms are evaluated.
+    """
+    patterns = tuple(p for p in range(8) if rule >> p & 1)
+    if len(patterns) > 4:
+        return tuple(p for p in range(8) if not rule >> p & 1), True
+    return patterns, False
+
+def apply_rule(terms, left, center, right, full):
+    """Evaluates rule_terms bitwise on ints or uint64 arrays; `full` is the all-ones value."""
+    patterns, invert = terms
+    literals = ((left ^ full, left), (center ^ full, center), (right ^ full, right))
+    result = 0 if isinstance(left, int) else np.zeros_like(left)
+    for p in patterns:
+        result = result | (literals[0][p >> 2 & 1] & literals[1][p >> 1 & 1] & literals[2][p & 1])
+    return result ^ full if invert else result
+
+# --- Engine ---
+
+class ElementaryCA:
+    """An elementary cellular automaton over packed uint64 rows of arbitrary width."""
+
+    def __init__(self, rule=30, width=64, boundary='fixed', state=None):
+        if not 0 <= rule <= 255:
+            raise ValueError(f"elementary rule must be in 0..255, got {rule}")
+        if boundary not in BOUNDARIES:
+            raise ValueError(f"boundary must be one of {BOUNDARIES}, got {boundary!r}")
+        self.rule = rule
+        self.terms = rule_terms(rule)
+        self.width = width
+        self.boundary = boundary
+        self.words = words_for(width)
+        self.mask = np.full(self.words, _ALL, dtype=np.uint64)
+        self.mask[-1] = tail_mask(width)
+        self.state = single_cell_row(width) if state is None else np.array(state, dtype=np.uint64)
+        self.state &= self.mask
+        self.full = int(self.mask[-1])  # All-ones value of a single-word row
+        self.generation = 0
+
+    def step(self):
+        """Advances one generation in place and returns the new row."""
+        if self.words == 1:
+            # A single word is stepped as a Python int, which is cheaper than array dispatch
+            self.state[0] = self._step_int(int(self.state[0]))
+        else:
+            self.state = self._step_words(self.state)
+        self.generation += 1
+        return self.state
+
+    def _step_int(self, row):
+        full = self.full
+        left = (row << 1) & full
+        right = row >> 1
+        if self.boundary == 'periodic':
+            left |= row >> (self.width - 1) & 1
+            right |= (row & 1) << (self.width - 1)
+        return apply_rule(self.terms, left, row, right, full) & full
+
+    def _step_words(self, row):
+        # left[j] holds cell j - 1 and right[j] holds cell j + 1
+        left = row << _ONE
+        left[1:] |= row[:-1] >> _TOP
+        right = row >> _ONE
+        right[:-1] |= row[1:] << _TOP
+        if self.boundary == 'periodic':
+            last_word, last_bit = divmod(self.width - 1, WORD_BITS)
+            left[0] |= row[last_word] >> np.uint64(last_bit) & _ONE
+            right[last_word] |= (row[0] & _ONE) << np.uint64(last_bit)
+        return apply_rule(self.terms, left, row, right, _ALL) & self.mask
+
+    def iter_rows(self, count=None):
+        """Lazily yields copies of the packed rows, starting with the current one."""
+        produced = 0
+        while count is None or produced < count:
+            yield self.state.copy()
+            produced += 1
+            if count is None or produced < count:
+                self.step()
+
+    def iter_blocks(self, block_rows, count=None):
+        """Lazily yields (rows, words) arrays of up to `block_rows` consecutive rows."""
+        remaining = count
+        while remaining is None or remaining > 0:
+            size = block_rows if remaining is None else min(block_rows, remaining)
+            if self.words == 1:
+                rows = [int(self.state[0])]
+                for i in range(size - 1):
+                    rows.append(self._step_int(rows[-1]))
+                block = np.array(rows, dtype=np.uint64).reshape(-1, 1)
+            else:
+                block = np.empty((size, self.words), dtype=np.uint64)
+                block[0] = self.state
+                for i in range(1, size):
+                    block[i] = self._step_words(block[i - 1])
+            self.generation += size - 1
+            self.state = block[-1].copy()
+            if remaining is not None:
+                remaining -= size
+            yield block
+            # The next block starts one generation after the last row of this one
+            if remaining is None or remaining > 0:
+                self.step()
+
+# --- Space-Time Files ---
+
+# A space-time file is a fixed 64 byte header followed by the packed rows,
+# one after another. Row g starts at data_offset + g * row_bytes, so any
+# generation window is a slice of a memory map and never needs the whole
+# history in RAM.
+SPACETIME_MAGIC = b'ECASPT01'
+SPACETIME_HEADER = np.dtype([('magic', 'S8'), ('rule', '<u8'), ('width', '<u8'), ('words', '<u8'),
+                             ('boundary', '<u8'), ('generations', '<u8'), ('data_offset', '<u8'),
+                             ('row_bytes', '<u8')])
+
+def write_spacetime(path, automaton, generations, block_rows=4096):
+    """Streams `generations` rows of the automaton into a memory-mapped space-time file."""
+    header = np.zeros((), dtype=SPACETIME_HEADER)
+    header['magic'] = SPACETIME_MAGIC
+    header['rule'] = automaton.rule
+    header['width'] = automaton.width
+    header['words'] = automaton.words
+    header['boundary'] = BOUNDARIES.index(automaton.boundary)
+    header['generations'] = generations
+    header['data_offset'] = SPACETIME_HEADER.itemsize
+    header['row_bytes'] = automaton.words * 8
+    with open(path, 'wb') as out:
+        out.write(header.tobytes())
+        out.truncate(SPACETIME_HEADER.itemsize + generations * automaton.words * 8)
+    if generations == 0:
+        return
+    rows = np.memmap(path, dtype='<u8', mode='r+', offset=SPACETIME_HEADER.itemsize,
+                     shape=(generations, automaton.words))
+    start = 0
+    for block in automaton.iter_blocks(block_rows, generations):
+        rows[start:start + len(block)] = block
+        rows.flush()
+        start += len(block)
+    del rows
+
+class SpaceTime:
+    """Random access to the generations stored in a space-time file."""
+
+    def __init__(self, path):
+        header = np.fromfile(path, dtype=SPACETIME_HEADER, count=1)[0]
+        if header['magic'] != SPACETIME_MAGIC:
+            raise ValueError(f"{path} is not a cellular automaton space-time file")
+        self.path = path
+        self.rule = int(header['rule'])
+        self.width = int(header['width'])
+        self.boundary = BOUNDARIES[int(header['boundary'])]
+        self.generations = int(header['generations'])
+        self.rows = np.memmap(path, dtype='<u8', mode='r', offset=int(header['data_offset']),
+                              shape=(self.generations, int(header['words'])))
+
+    def __len__(self):
+        return self.generations
+
+    def window(self, start, stop):
+        """Packed rows for generations start..stop-1, read from the memory map."""
+        return np.array(self.rows[start:stop])
+
+    def cells(self, start, stop, first_cell=0, last_cell=None):
+        """Unpacked 0/1 cells for a generation window and optional column range."""
+        last_cell = self.width if last_cell is None else last_cell
+        first_word = first_cell // WORD_BITS
+        last_word = words_for(last_cell)
+        cells = unpack_rows(self.rows[start:stop, first_word:last_word], (last_word - first_word) * WORD_BITS)
+        offset = first_cell - first_word * WORD_BITS
+        return cells[:, offset:offset + last_cell - first_cell]
+
+# --- Rendering ---
+
+def rows_to_raster(rows, width, scale=1):
+    """Converts (generations, words) packed rows into a 0/1 raster, `scale` pixels per cell."""
+    return scale_image(unpack_rows(rows, width), scale)
+
+def save_raster(path, rows, width, scale=1):
+    """Writes packed rows as a 1-bit .png or .pbm image, live cells in black."""
+    raster = rows_to_raster(rows, width, scale)
+    if path.endswith('.pbm'):
+        write_pbm(path, raster)
+    else:
+        write_png_bits(path, raster)
+
+def cell_runs(cells):
+    """(start, stop) column pairs of the horizontal runs of live cells in one unpacked row."""
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], cells.astype(np.int8), [0]))))
+    return edges.reshape(-1, 2)
+
+# --- Center Column ---
+
+def _shift(row, k):
+    return row >> k if k >= 0 else row << -k
+
+def iter_center_column(count=None, rule=30, block_bits=1 << 16):
+    """Yields the center-column bits of a single-cell automaton as uint8 0/1 blocks.
+
+    Only the light cone that can still reach the center is evolved. The row is
+    a Python int whose bit 0 is the leftmost needed cell. At generation t it
+    holds 2*h + 1 cells with h = t while the pattern grows. When `count` is
+    known, h = min(t, count - 1 - t), so the cells that cannot influence any
+    remaining center bit are dropped as the run nears its end.
+    """
+    if rule & 1:
+        raise ValueError("center column needs a rule that keeps an all-dead background dead")
+    terms = rule_terms(rule)
+    row, half, t = 1, 0, 0
+    while count is None or t < count:
+        size = block_bits if count is None else min(block_bits, count - t)
+        block = np.empty(size, dtype=np.uint8)
+        for i in range(size):
+            block[i] = row >> half & 1
+            t += 1
+            new_half = t if count is None else min(t, count - 1 - t)
+            if new_half < 0:
+                break
+            # Moving the window's left edge by d cells reindexes left, center and right
+            d = half - new_half
+            full = (1 << (2 * new_half + 1)) - 1
+            row = apply_rule(terms, _shift(row, d - 1), _shift(row, d), _shift(row, d + 1), full) & full
+            half = new_half
+        yield block
+
+def center_column_words(count, rule=30):
+    """The first `count` center-column bits packed little-endian into uint64 words."""
+    bits = np.concatenate(list(iter_center_column(count, rule)) or [np.empty(0, dtype=np.uint8)])
+    padded = np.zeros(words_for(count) * WORD_BITS, dtype=np.uint8)
+    padded[:count] = bits
+    return np.packbits(padded, bitorder='little').view('<u8').astype(np.uint64)
+
+def center_column_bytes(count, rule=30):
+    """The first `count` center-column bits packed little-endian into bytes."""
+    return center_column_words(count, rule).view(np.uint8)[:(count + 7) // 8].tobytes()
+
+def benchmark_center_column(counts=(10 ** 3, 10 ** 4, 10 ** 5)):
+    """Prints the center-column generator throughput in bits per second."""
+    import time
+    for count in counts:
+        start = time.perf_counter()
+        center_column_words(count)
+        elapsed = time.perf_counter() - start
+        print(f"{count:>10} bits: {elapsed:8.3f} s  {count / elapsed:14,.0f} bits/s")
+
+if __name__ == '__main__':
+    benchmark_center_column()
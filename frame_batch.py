@@ -0,0 +1,89 @@
+"""
+Frame batching for the turtle scenes.
+
+With the tracer on, Tk redraws the canvas after every turtle move, even at
+speed(0). FrameBatch turns the tracer off while a scene draws and refreshes
+the screen itself, once every SEGMENTS moves or every INTERVAL_MS
+milliseconds, whichever comes first. Each refresh also runs pending Tk
+events, so windows stay responsive and ontimer callbacks (the clock in
+watch.py) keep firing.
+
+    with FrameBatch(screen, skk):
+        sprirograph(fibonacci)
+
+Moves are counted by wrapping the drawing methods of the given turtles for
+the duration of the block; scenes that use the module-level functions
+(from turtle import *) get the anonymous default turtle.
+"""
+import importlib
+import sys
+import time
+
+SEGMENTS = 500     # Moves drawn between screen refreshes
+INTERVAL_MS = 30   # Longest wait between refreshes while drawing
+MOVES = ('forward', 'fd', 'back', 'bk', 'backward', 'goto', 'setpos', 'setposition',
+         'setx', 'sety', 'circle', 'dot', 'stamp')
+
+def _turtle():
+    """The module currently installed as `turtle`, so turtle_recorder's stand-in is honored."""
+    return importlib.import_module('turtle')
+
+class FrameBatch:
+    """Context manager that draws `turtles` with the tracer off and refreshes on a budget."""
+
+    def __init__(self, screen=None, *turtles, segments=SEGMENTS, interval_ms=INTERVAL_MS):
+        self.screen = _turtle().Screen() if screen is None else screen
+        self.turtles = turtles or (_turtle().getturtle(),)
+        self.segments = segments
+        self.interval = interval_ms / 1000.0
+        self.pending = 0
+        self.frames = 0
+        self.deadline = 0.0
+        self._saved = None
+
+    def tick(self, count=1):
+        """Counts `count` moves and refreshes the screen once the budget is used up."""
+        self.pending += count
+        if self.pending >= self.segments or time.monotonic() >= self.deadline:
+            self.flush()
+
+    def flush(self):
+        """Draws everything pending and handles waiting Tk events."""
+        self.screen.update()
+        # An ontimer callback run by update() may have turned tracing back on
+        self.screen.tracer(0, 0)
+        self.pending = 0
+        self.frames += 1
+        self.deadline = time.monotonic() + self.interval
+
+    def _wrap(self, drawer, name):
+        move = getattr(drawer, name)
+        def batched(*args, **kwargs):
+            result = move(*args, **kwargs)
+            self.tick()
+            return result
+        setattr(drawer, name, batched)
+
+    def __enter__(self):
+        self._saved = (self.screen.tracer(), self.screen.delay())
+        self.screen.tracer(0, 0)
+        for drawer in self.turtles:
+            for name in MOVES:
+                self._wrap(drawer, name)
+        self.pending = 0
+        self.deadline = time.monotonic() + self.interval
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        for drawer in self.turtles:
+            for name in MOVES:
+                drawer.__dict__.pop(name, None)
+        # TclError is looked up lazily so scenes still import where Tk is missing, e.g. under turtle_recorder
+        tkinter = sys.modules.get('tkinter')
+        closed = (_turtle().Terminator,) + ((tkinter.TclError,) if tkinter else ())
+        try:
+            self.screen.tracer(*self._saved)
+            self.screen.update()
+        except closed:
+            pass  # The window was closed while drawing
+        return False
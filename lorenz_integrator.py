@@ -0,0 +1,214 @@
+"""
+Vectorized ensemble integrators for the Lorenz systems.
+
+An ensemble is an (N, dim) array holding N initial conditions, advanced
+together with classic fourth-order Runge-Kutta. lorenz3 is the system of
+LorenzAttractor01.py, and lorenz5 is the 5-dimensional extension from
+LorenzAttractor02.f. Derivatives write into a preallocated output array,
+and the integrator reuses its stage buffers between steps, so a step
+allocates nothing that grows with the ensemble beyond NumPy temporaries.
+"""
+import hashlib
+import json
+import os
+
+import numpy as np
+
+# Parameters of LorenzAttractor01.py
+RHO = 28.0
+SIGMA = 10.0
+BETA = 8.0 / 3.0
+
+# Parameters of LorenzAttractor02.py
+RHO5 = 43.5
+D0 = 19.0 / 3.0
+
+# --- Systems ---
+
+def lorenz3(state, out, rho=RHO, sigma=SIGMA, beta=BETA):
+    """Classic Lorenz derivatives of an (N, 3) ensemble, written into `out`."""
+    x, y, z = state[:, 0], state[:, 1], state[:, 2]
+    out[:, 0] = sigma * (y - x)
+    out[:, 1] = x * (rho - z) - y
+    out[:, 2] = x * y - beta * z
+    return out
+
+def lorenz5(state, out, rho=RHO5, sigma=SIGMA, beta=BETA, d0=D0):
+    """5-dimensional Lorenz derivatives of an (N, 5) ensemble, as in LorenzAttractor02.f."""
+    x, y, z, y1, z1 = state[:, 0], state[:, 1], state[:, 2], state[:, 3], state[:, 4]
+    out[:, 0] = sigma * (y - x)
+    out[:, 1] = x * (rho - z) - y
+    out[:, 2] = x * y - x * y1 - beta * z
+    out[:, 3] = x * z - 2 * x * z1 - d0 * y1
+    out[:, 4] = 2 * x * y1 - 4 * beta * z1
+    return out
+
+SYSTEMS = {3: lorenz3, 5: lorenz5}
+
+# --- Integrator ---
+
+class EnsembleRK4:
+    """Fourth-order Runge-Kutta stepper for an (N, dim) ensemble with reusable stage buffers."""
+
+    def __init__(self, derivative, shape, **params):
+        self.derivative = derivative
+        self.params = params
+        self.k1, self.k2, self.k3, self.k4 = (np.empty(shape) for i in range(4))
+        self.stage = np.empty(shape)
+
+    def step(self, state, dt):
+        """Advances `state` by one step of size dt, in place."""
+        f, p = self.derivative, self.params
+        k1, k2, k3, k4, stage = self.k1, self.k2, self.k3, self.k4, self.stage
+        f(state, k1, **p)
+        np.multiply(k1, dt / 2, out=stage)
+        stage += state
+        f(stage, k2, **p)
+        np.multiply(k2, dt / 2, out=stage)
+        stage += state
+        f(stage, k3, **p)
+        np.multiply(k3, dt, out=stage)
+        stage += state
+        f(stage, k4, **p)
+        # state += dt / 6 * (k1 + 2 k2 + 2 k3 + k4), accumulated in k1
+        k2 += k3
+        k2 *= 2
+        k1 += k2
+        k1 += k4
+        k1 *= dt / 6
+        state += k1
+        return state
+
+    def integrate(self, state, dt, steps, record_every=1):
+        """Advances `state` in place and returns every `record_every`-th state as (records, N, dim)."""
+        records = np.empty((steps // record_every + 1,) + state.shape)
+        records[0] = state
+        for i in range(1, steps + 1):
+            self.step(state, dt)
+            if i % record_every == 0:
+                records[i // record_every] = state
+        return records
+
+def iter_trajectory(derivative, state0, dt, steps=None, chunk=500, **params):
+    """Yields a single trajectory as (n, dim) chunks, starting with state0.
+
+    `steps` RK4 steps are taken in total, or forever when it is None. Only
+    the current chunk is held in memory, and the stepper carries its state
+    across chunks, so the chunk size never changes the values produced.
+    """
+    state = np.array(state0, dtype=float).reshape(1, -1)
+    stepper = EnsembleRK4(derivative, state.shape, **params)
+    remaining = None if steps is None else steps + 1
+    first = True
+    while remaining is None or remaining > 0:
+        size = chunk if remaining is None else min(chunk, remaining)
+        block = np.empty((size, state.shape[1]))
+        for i in range(size):
+            if not first:
+                stepper.step(state, dt)
+            first = False
+            block[i] = state[0]
+        if remaining is not None:
+            remaining -= size
+        yield block
+
+def ensemble_around(state0, count, spread=1e-8, seed=None):
+    """`count` initial conditions scattered uniformly within +-spread of state0."""
+    rng = np.random.default_rng(seed)
+    state0 = np.asarray(state0, dtype=float)
+    return state0 + rng.uniform(-spread, spread, size=(count, len(state0)))
+
+def separation(ensemble, reference):
+    """Euclidean distance of every ensemble member from a reference state, for divergence studies."""
+    return np.linalg.norm(ensemble - reference, axis=-1)
+
+# --- Trajectory Cache ---
+
+CACHE_DIR = "lorenz_cache"
+CACHE_BYTES = 512 * 1024 * 1024  # Least recently used trajectories are evicted beyond this size
+
+class TrajectoryCache:
+    """On-disk trajectory cache keyed by system, parameters, initial state, time grid and integrator.
+
+    Trajectories are stored as .npy files and returned memory-mapped on a hit.
+    File modification times record the last use, and the least recently used
+    files are evicted once the cache grows beyond max_bytes.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=CACHE_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, derivative, state0, dt, steps, **params):
+        """Hash of everything that determines the trajectory."""
+        description = {
+            'system': derivative.__name__,
+            'params': {name: float(value) for name, value in sorted(params.items())},
+            'state0': [float(value) for value in np.ravel(state0)],
+            'dt': float(dt),
+            'steps': int(steps),
+            'integrator': 'rk4',
+        }
+        return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + ".npy")
+
+    def lookup(self, key):
+        """Returns the memory-mapped trajectory for a key, or None on a miss."""
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        os.utime(path)  # Mark as most recently used
+        return np.load(path, mmap_mode='r')
+
+    def iter_chunks(self, derivative, state0, dt, steps, chunk=500, **params):
+        """Yields trajectory chunks from the cache, or integrates them while filling the cache."""
+        key = self.key(derivative, state0, dt, steps, **params)
+        cached = self.lookup(key)
+        if cached is not None:
+            for start in range(0, len(cached), chunk):
+                yield cached[start:start + chunk]
+            return
+        path = self._path(key)
+        partial = path + ".partial"
+        records = np.lib.format.open_memmap(partial, mode='w+', dtype=float, shape=(steps + 1, len(np.ravel(state0))))
+        try:
+            start = 0
+            for block in iter_trajectory(derivative, state0, dt, steps, chunk, **params):
+                records[start:start + len(block)] = block
+                start += len(block)
+                yield block
+            records.flush()
+            del records
+            os.replace(partial, path)
+        finally:
+            # An abandoned run leaves no half-written trajectory behind
+            if os.path.exists(partial):
+                os.remove(partial)
+        self.evict()
+
+    def trajectory(self, derivative, state0, dt, steps, **params):
+        """The whole (steps + 1, dim) trajectory, integrated only on a miss."""
+        key = self.key(derivative, state0, dt, steps, **params)
+        cached = self.lookup(key)
+        if cached is None:
+            for block in self.iter_chunks(derivative, state0, dt, steps, **params):
+                pass
+            cached = self.lookup(key)
+        return cached
+
+    def evict(self):
+        """Removes least recently used trajectories until the cache fits in max_bytes, keeping the newest."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".npy"):
+                info = os.stat(os.path.join(self.cache_dir, name))
+                entries.append((info.st_mtime, info.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries)[:-1]:
+            if total <= self.max_bytes:
+                break
+            os.remove(os.path.join(self.cache_dir, name))
+            total -= size
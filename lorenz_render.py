@@ -0,0 +1,55 @@
+"""
+Fast rendering paths for the Lorenz turtle plots.
+
+The turtle path turns the tracer off and sends the trajectory in chunks,
+refreshing the screen once per chunk instead of once per segment. The image
+path rasterizes every segment with NumPy and needs no window at all.
+Colors for all segments are drawn in one vectorized call up front.
+"""
+import numpy as np
+
+from raster import draw_segments, world_to_pixel, write_png
+
+CHUNK = 500  # Segments drawn between screen updates
+
+def segment_colors(count, seed=None):
+    """Random RGB colors in [0, 1) for `count` segments, in one call."""
+    return np.random.default_rng(seed).random((count, 3))
+
+def draw_polyline(drawer, screen, points, colors=None, chunk=CHUNK):
+    """Moves the turtle through (N, 2) points with one screen update per chunk of segments."""
+    screen.tracer(0, 0)
+    for start in range(0, len(points), chunk):
+        block = points[start:start + chunk].tolist()
+        if colors is None:
+            for x, y in block:
+                drawer.setpos(x, y)
+        else:
+            for (x, y), color in zip(block, colors[start:start + chunk].tolist()):
+                drawer.pencolor(color)
+                drawer.setpos(x, y)
+        screen.update()
+
+def fit_viewport(points, margin=0.05):
+    """(xmin, ymin, xmax, ymax) around (N, 2) points with a relative margin."""
+    lo = points.min(axis=0)
+    hi = points.max(axis=0)
+    pad = (hi - lo) * margin + 1e-9
+    return tuple(lo - pad) + tuple(hi + pad)
+
+def render_polyline(points, colors=None, width=1920, height=1200, viewport=None, background=(0, 0, 0)):
+    """Rasterizes the polyline through (N, 2) points into an RGB image; colors are per segment in [0, 1)."""
+    viewport = fit_viewport(points) if viewport is None else viewport
+    image = np.empty((height, width, 3), dtype=np.uint8)
+    image[:] = background
+    pixels = world_to_pixel(points, viewport, width, height)
+    if colors is None:
+        colors = np.array([255, 0, 0], dtype=np.uint8)
+    else:
+        colors = (np.asarray(colors[:len(points) - 1]) * 255).astype(np.uint8)
+    draw_segments(image, pixels[:-1], pixels[1:], colors)
+    return image
+
+def save_polyline(path, points, colors=None, **options):
+    """Renders the polyline headlessly and writes it as a PNG."""
+    write_png(path, render_polyline(points, colors, **options))
@@ -0,0 +1,124 @@
+"""
+Parameter sweeps over (rho, sigma, beta) for the Lorenz systems.
+
+Every grid point gets an estimate of the largest Lyapunov exponent from the
+two-trajectory (Benettin) method. A reference and a slightly perturbed copy
+are integrated together, their separation is measured and renormalized at a
+fixed interval, and the exponent is the mean log growth per unit time.
+A positive exponent marks a chaotic regime.
+
+The grid is split into batches, and each batch is integrated as one RK4
+ensemble in a worker process. Results go into a single memory-mapped .npy
+array of shape (len(rhos), len(sigmas), len(betas)). Entries still NaN are
+pending, so an interrupted sweep resumes where it stopped. The grid axes
+and integration settings are kept in a JSON file next to the array, and a
+resume with different ones is refused.
+"""
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from lorenz_integrator import SYSTEMS, D0, EnsembleRK4
+
+# --- Sweep Configuration ---
+RHOS = np.linspace(0.0, 60.0, 61)
+SIGMAS = np.linspace(1.0, 20.0, 20)
+BETAS = np.array([8.0 / 3.0])
+DIM = 3              # 3 for LorenzAttractor01, 5 for the variant in LorenzAttractor02
+DT = 0.01
+STEPS = 20000        # Steps measured after the transient
+TRANSIENT = 2000     # Steps discarded so the orbit settles onto the attractor
+RENORM_EVERY = 10    # Steps between separation renormalizations
+DELTA = 1e-8         # Initial separation of the perturbed copy
+BATCH = 64           # Grid points integrated together in one worker job
+OUTPUT_PATH = "lorenz_sweep.npy"
+
+# --- Lyapunov Exponent ---
+
+def largest_lyapunov(points, dim=DIM, dt=DT, steps=STEPS, transient=TRANSIENT,
+                     renorm_every=RENORM_EVERY, delta=DELTA):
+    """Largest Lyapunov exponent for each (rho, sigma, beta) row of `points`."""
+    points = np.asarray(points, dtype=float)
+    count = len(points)
+    # Rows 0..count-1 are the references and rows count..2*count-1 their perturbed copies
+    rho, sigma, beta = (np.tile(points[:, k], 2) for k in range(3))
+    params = {'rho': rho, 'sigma': sigma, 'beta': beta}
+    if dim == 5:
+        params['d0'] = D0
+    state = np.ones((2 * count, dim))
+    stepper = EnsembleRK4(SYSTEMS[dim], state.shape, **params)
+    for i in range(transient):
+        stepper.step(state, dt)
+    state[count:] = state[:count]
+    state[count:, 0] += delta
+    log_growth = np.zeros(count)
+    for i in range(1, steps + 1):
+        stepper.step(state, dt)
+        if i % renorm_every == 0:
+            offset = state[count:] - state[:count]
+            distance = np.linalg.norm(offset, axis=1)
+            # A collapsed separation (a stable fixed point) contributes log(tiny) instead of NaN
+            distance = np.maximum(distance, np.finfo(float).tiny)
+            log_growth += np.log(distance / delta)
+            state[count:] = state[:count] + offset * (delta / distance)[:, np.newaxis]
+    return log_growth / (steps // renorm_every * renorm_every * dt)
+
+def _sweep_job(indices, points, dim, settings):
+    return indices, largest_lyapunov(points, dim, **settings)
+
+# --- Sweep Runner ---
+
+def _settings_path(path):
+    return os.path.splitext(path)[0] + ".json"
+
+def run_sweep(path=OUTPUT_PATH, rhos=RHOS, sigmas=SIGMAS, betas=BETAS, dim=DIM, batch=BATCH, workers=None,
+              dt=DT, steps=STEPS, transient=TRANSIENT, renorm_every=RENORM_EVERY):
+    """Fills the result array at `path`, resuming if it already exists, and returns it."""
+    shape = (len(rhos), len(sigmas), len(betas))
+    settings = {'dt': float(dt), 'steps': int(steps), 'transient': int(transient),
+                'renorm_every': int(renorm_every)}
+    meta = {'rhos': [float(v) for v in rhos], 'sigmas': [float(v) for v in sigmas],
+            'betas': [float(v) for v in betas], 'dim': int(dim), **settings}
+    if os.path.exists(path):
+        results = np.load(path, mmap_mode='r+')
+        if results.shape != shape:
+            raise ValueError(f"{path} holds a {results.shape} sweep, expected {shape}")
+        if not os.path.exists(_settings_path(path)):
+            raise ValueError(f"{path} has no {_settings_path(path)} recording its grid and settings")
+        with open(_settings_path(path)) as saved_file:
+            saved = json.load(saved_file)
+        changed = sorted(name for name in meta if saved.get(name) != meta[name])
+        if changed:
+            raise ValueError(f"{path} was computed with different {', '.join(changed)}")
+    else:
+        results = np.lib.format.open_memmap(path, mode='w+', dtype=float, shape=shape)
+        results[:] = np.nan
+        results.flush()
+        with open(_settings_path(path), 'w') as saved_file:
+            json.dump(meta, saved_file)
+
+    grid = np.stack(np.meshgrid(rhos, sigmas, betas, indexing='ij'), axis=-1).reshape(-1, 3)
+    pending = np.flatnonzero(np.isnan(results.reshape(-1)))
+    total = results.size
+    done = total - len(pending)
+    print(f"{done}/{total} grid points already done, {len(pending)} to go")
+    started = time.time()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        jobs = [pool.submit(_sweep_job, chunk, grid[chunk], dim, settings)
+                for chunk in np.array_split(pending, max(1, -(-len(pending) // batch)))
+                if len(chunk)]
+        for job in as_completed(jobs):
+            indices, exponents = job.result()
+            results.reshape(-1)[indices] = exponents
+            results.flush()
+            done += len(indices)
+            elapsed = time.time() - started
+            print(f"{done}/{total} grid points ({100 * done / total:.1f}%), {elapsed:.1f} s elapsed")
+    return results
+
+if __name__ == '__main__':
+    run_sweep()
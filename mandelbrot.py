@@ -19,19 +19,25 @@ Overall, this code provides a great example of how the turtle library can be use
 
 @author: Arce
 """
+import os
 import turtle
-# Set the screen's background color
-turtle.bgcolor("black")
-# Set the turtle's pen color to white
-turtle.pencolor("white")
-# Set the turtle's pen size to 1 pixel
-turtle.pensize(1)
-# Set the turtle's speed to the maximum
-turtle.speed(0)
-# Set the screen size and the maximum number of iterations
-turtle.screensize(canvwidth=7680, canvheight=4800, bg='black')
+from collections import OrderedDict
+
+import numpy as np
+
+# Set the maximum number of iterations
 max_iterations = 256
 
+# --- Tile Cache Configuration ---
+# The view at zoom level 0 is a single tile covering [-2, 2] x [-2, 2].
+# Every zoom level splits each tile into 4 children (a quadtree), so zoom z
+# has 2**z x 2**z tiles of TILE_SIZE x TILE_SIZE escape counts each.
+PLANE_MIN = -2.0
+PLANE_SPAN = 4.0
+TILE_SIZE = 200
+CACHE_DIR = "mandelbrot_tiles"
+MEMORY_TILES = 64  # Tiles kept in the in-memory LRU layer
+
 # Define the escape time function
 def escape_time(c):
     z = 0
@@ -41,15 +47,132 @@ def escape_time(c):
             return i
     return max_iterations
 
-# Iterate over the complex plane
-for x in range(-400, 400):
-    for y in range(-400, 400):
-        c = complex(x/200, y/200)
-        i = escape_time(c)
-        if i == max_iterations:
-            turtle.goto(x, y)
+def escape_time_grid(c, iterations=max_iterations):
+    """Vectorized escape_time over an array of complex points."""
+    z = np.zeros_like(c)
+    counts = np.full(c.shape, iterations, dtype=np.uint16)
+    active = np.ones(c.shape, dtype=bool)
+    for i in range(iterations):
+        z[active] = z[active] * z[active] + c[active]
+        escaped = active & (np.abs(z) > 2)
+        counts[escaped] = i
+        active &= ~escaped
+        if not active.any():
+            break
+    return counts
+
+def tile_plane(zoom, tx, ty, size=TILE_SIZE):
+    """Complex points for tile (tx, ty) at a zoom level; rows are imaginary, columns real."""
+    step = PLANE_SPAN / (2 ** zoom) / size
+    re = PLANE_MIN + (tx * size + np.arange(size)) * step
+    im = PLANE_MIN + (ty * size + np.arange(size)) * step
+    return re[np.newaxis, :] + 1j * im[:, np.newaxis]
+
+class TileCache:
+    """Quadtree tile cache with an in-memory LRU layer over compressed tiles on disk."""
+
+    def __init__(self, cache_dir=CACHE_DIR, capacity=MEMORY_TILES, size=TILE_SIZE):
+        self.cache_dir = cache_dir
+        self.capacity = capacity
+        self.size = size
+        self.memory = OrderedDict()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key):
+        zoom, tx, ty, iterations = key
+        # Tile size is part of the name so caches of different sizes can share a directory
+        return os.path.join(self.cache_dir, f"{zoom}_{tx}_{ty}_{iterations}_{self.size}.npz")
+
+    def _remember(self, key, tile):
+        self.memory[key] = tile
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.capacity:
+            self.memory.popitem(last=False)
+
+    def peek(self, zoom, tx, ty, iterations=max_iterations):
+        """Returns a cached tile from memory or disk, or None without computing."""
+        key = (zoom, tx, ty, iterations)
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            return self.memory[key]
+        path = self._path(key)
+        if os.path.exists(path):
+            with np.load(path) as data:
+                tile = data["counts"]
+            self._remember(key, tile)
+            return tile
+        return None
+
+    def get(self, zoom, tx, ty, iterations=max_iterations):
+        """Returns the escape counts of a tile, computing and storing it on a miss."""
+        tile = self.peek(zoom, tx, ty, iterations)
+        if tile is None:
+            tile = escape_time_grid(tile_plane(zoom, tx, ty, self.size), iterations)
+            np.savez_compressed(self._path((zoom, tx, ty, iterations)), counts=tile)
+            self._remember((zoom, tx, ty, iterations), tile)
+        return tile
+
+    def preview(self, zoom, tx, ty, iterations=max_iterations):
+        """Low-resolution tile upsampled from the nearest cached ancestor, or None."""
+        for depth in range(1, zoom + 1):
+            parent = self.peek(zoom - depth, tx >> depth, ty >> depth, iterations)
+            if parent is None:
+                continue
+            # Child pixel i maps to ancestor pixel (offset * size + i) // 2**depth
+            offset_x = tx - ((tx >> depth) << depth)
+            offset_y = ty - ((ty >> depth) << depth)
+            cols = (offset_x * self.size + np.arange(self.size)) >> depth
+            rows = (offset_y * self.size + np.arange(self.size)) >> depth
+            return parent[np.ix_(rows, cols)]
+        return None
+
+    def tiles(self, zoom, iterations=max_iterations):
+        """Yields (tx, ty, tile, final) for every tile at a zoom level.
+
+        Previews of all missing tiles come first (final False), so a viewer can
+        show the whole level at once; then every tile is yielded exactly
+        (final True), computing the missing ones.
+        """
+        count = 2 ** zoom
+        keys = [(tx, ty) for ty in range(count) for tx in range(count)]
+        missing = [(tx, ty) for tx, ty in keys if self.peek(zoom, tx, ty, iterations) is None]
+        for tx, ty in missing:
+            preview = self.preview(zoom, tx, ty, iterations)
+            if preview is not None:
+                yield tx, ty, preview, False
+        for tx, ty in keys:
+            yield tx, ty, self.get(zoom, tx, ty, iterations), True
+
+# --- Main Execution ---
+
+def main():
+    # Set the screen's background color
+    turtle.bgcolor("black")
+    # Set the turtle's pen color to white
+    turtle.pencolor("white")
+    # Set the turtle's pen size to 1 pixel
+    turtle.pensize(1)
+    # Set the turtle's speed to the maximum
+    turtle.speed(0)
+    turtle.screensize(canvwidth=7680, canvheight=4800, bg='black')
+
+    # Zoom 2 with 200 pixel tiles covers x, y in [-400, 400) at 200 pixels per unit
+    cache = TileCache()
+    zoom = 2
+    half = (2 ** zoom) * TILE_SIZE // 2
+    # The single zoom-0 tile is cheap and gives every zoom-2 tile a preview
+    cache.get(0, 0, 0)
+    for tx, ty, tile, final in cache.tiles(zoom):
+        # Previews are drawn dim and the exact tiles over them in white
+        turtle.pencolor("white" if final else "gray")
+        # Iterate over the members of the set in this tile
+        for row, col in zip(*np.nonzero(tile == max_iterations)):
+            turtle.goto(tx * TILE_SIZE + col - half, ty * TILE_SIZE + row - half)
             turtle.dot()
 
-# Hide the turtle and keep the screen open
-turtle.hideturtle()
-turtle.exitonclick()
+    # Hide the turtle and keep the screen open
+    turtle.hideturtle()
+    turtle.exitonclick()
+
+if __name__ == '__main__':
+    main()
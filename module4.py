@@ -2,6 +2,8 @@ import turtle
 from random import randint
 import math
 
+from recurrences import LinearRecurrence
+
 # Number of sides and length of the star
 n = 12  # Number of segments in the star pattern
 s = 10  # Size scaling factor for each Fibonacci step
@@ -19,19 +21,8 @@ turtle.colormode(255)  # Enable RGB color mode
 skk.width(2)  # Set the pen width
 skk.goto(0, 0)
 
-# Memoization for Fibonacci
-memo = {}
-
-def fibonacci(n):
-    """Generate Fibonacci sequence with custom rules."""
-    if n in memo:
-        return memo[n]
-    if n <= 2:
-        f = 1
-    else:
-        f = fibonacci(n-2) + fibonacci(n-3)  # Adjust Fibonacci relation
-    memo[n] = f
-    return f
+# Custom Fibonacci-like recurrence, evaluated by companion-matrix powers
+fibonacci = LinearRecurrence((2, 3))
 
 # Function to draw one "petal" of the pattern
 def draw_petal(fib_num):
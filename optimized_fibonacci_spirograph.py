@@ -1,36 +1,48 @@
-import pandas as pd
 import turtle
+from functools import lru_cache
+
+from frame_batch import FrameBatch
+from recurrences import fibonacci_list
+from trochoids import star_block, turtle_star
+
 #number of sides
 n = 13
 #lenght of the sizes
 l = 55
+SHOW_TABLE = False  # Print the sequence as a pandas DataFrame (imports pandas)
 turtle.screensize(canvwidth=7680, canvheight=4800, bg='black')
-def fibonacci(n):
-    fibo = []
-    for i in range(n):
-        if i == 0 or i == 1:
-            fibo.append(i)
-        else:
-            f = fibo[i-1] + fibo[i-2]
-            fibo.append(f)
-    return fibo
-
-fibonacci_numbers = fibonacci(n)
-df = pd.DataFrame(fibonacci_numbers, columns=['Fibonacci Number'])
-print(df)
+
+def print_table(numbers):
+    import pandas as pd
+    df = pd.DataFrame(numbers, columns=['Fibonacci Number'])
+    print(df)
+
+if SHOW_TABLE:
+    print_table(fibonacci_list(n))
+
+@lru_cache(maxsize=None)
+def star_path(n, l):
+    """Vertices of one closed period of the (n, l) star and the number of points per block."""
+    return turtle_star(n, l), len(star_block(n, l)[0])
+
+blocks_drawn = 0
 
 def sprirograph(fibonacci_sequence):
-    for f in fibonacci_sequence:
-        turtle.color('red')
-        turtle.speed(0)
-        for i in range(37):
-            if i == n or i == l:
-                turtle.forward(n)
-            turtle.forward(l)
-            turtle.left(n)
-        turtle.left(l)
-
-i = 0
-while i < 10: 
-    sprirograph(fibonacci(1000))
-    i += 1
+    # One block per number as before, replayed from the cached path; blocks past one period only retrace it
+    global blocks_drawn
+    path, per_block = star_path(n, l)
+    period = (len(path) - 1) // per_block
+    stop = min(blocks_drawn + len(fibonacci_sequence), period)
+    turtle.color('red')
+    for x, y in path[blocks_drawn * per_block + 1:stop * per_block + 1].tolist():
+        turtle.goto(x, y)
+    blocks_drawn = stop
+
+turtle.speed(0)
+sequence = fibonacci_list(1000)
+with FrameBatch():
+    i = 0
+    while i < 10: 
+        sprirograph(sequence)
+        i += 1
+turtle.done()
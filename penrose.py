@@ -2,6 +2,10 @@ import turtle
 import math
 from time import sleep
 
+import numpy as np
+
+from raster import fill_polygons, world_to_pixel, write_png
+
 # --- Constants ---
 # The Golden Ratio (Phi or Tau)
 PHI = (1.0 + math.sqrt(5.0)) / 2.0
@@ -14,6 +18,13 @@ PHI_INV = 1.0 / PHI
 # Each tile is a dictionary:
 # {'type': 'KITE'/'DART', 'vertices': [v1, v2, v3, v4]}
 
+# For deep tilings the same tiles are kept in an array store instead:
+# vertices is an (N, 4, 2) float array and types an (N,) uint8 array
+# holding KITE_ID or DART_ID, indexing into TILE_TYPES.
+TILE_TYPES = ('KITE', 'DART')
+KITE_ID = 0
+DART_ID = 1
+
 # The core of the Penrose Tiling is the substitution (or deflation) rule.
 # This rule replaces a large tile with a set of smaller tiles that are correctly
 # positioned and oriented.
@@ -21,7 +32,18 @@ PHI_INV = 1.0 / PHI
 # --- Drawing Configuration ---
 TILE_SCALE = 150  # Initial size of the tiles
 ITERATIONS = 3    # Number of substitution steps (3 is a good balance of detail/speed)
+DEFLATION_MODE = 'array'  # 'array' deflates round by round, 'template' uses cached templates,
+                          # 'culled' drops tiles outside VIEWPORT before each round
+VIEWPORT = (-400, -400, 400, 400)  # Visible region (xmin, ymin, xmax, ymax) of the 800x800 screen
 DRAW_SPEED = 0    # 0 = fastest drawing speed
+KITE_COLOR = "#336699"  # Blue
+DART_COLOR = "#E08F32"  # Orange
+WELD_TOLERANCE = 1e-6  # Vertices closer than this are welded into one shared vertex
+OUTLINE_ONLY = False   # Draw each unique edge once instead of filled tiles
+RENDER_BACKEND = 'turtle'  # 'turtle' draws interactively, 'image' writes OUTPUT_PATH (.png or .svg)
+OUTPUT_PATH = "penrose.png"
+BACKGROUND = (20, 20, 20)
+CHUNK_LEVEL = 6   # Streaming export expands the last 6 levels as one chunk of 3**6 tiles
 
 # --- Tiling Logic ---
 
@@ -170,10 +192,118 @@ def substitute_tiles(tiles):
             
     return new_tiles
 
+def tiles_to_arrays(tiles):
+    """Converts a list of tile dicts into the (vertices, types) array store."""
+    vertices = np.array([tile['vertices'] for tile in tiles], dtype=float).reshape(-1, 4, 2)
+    types = np.array([TILE_TYPES.index(tile['type']) for tile in tiles], dtype=np.uint8)
+    return vertices, types
+
+def arrays_to_tiles(vertices, types):
+    """Converts the (vertices, types) array store back into a list of tile dicts."""
+    return [{'type': TILE_TYPES[t], 'vertices': [tuple(v) for v in quad]}
+            for quad, t in zip(vertices.tolist(), types.tolist())]
+
+def substitute_tiles_array(vertices, types):
+    """Vectorized substitute_tiles over the array store; each tile's 3 children stay adjacent."""
+    children = np.empty((len(vertices), 3) + vertices.shape[1:], dtype=vertices.dtype)
+
+    # KITE: E on AB, F on AD, G on CA (same rule as substitute_tiles)
+    kites = types == KITE_ID
+    A, B, C, D = (vertices[kites, k] for k in range(4))
+    E = A + (B - A) * PHI_INV
+    F = A + (D - A) * PHI_INV
+    G = C + (A - C) * PHI_INV
+    children[kites] = np.stack([np.stack([A, E, G, F], axis=1),
+                                np.stack([E, B, C, G], axis=1),
+                                np.stack([F, G, C, D], axis=1)], axis=1)
+
+    # DART: E on BA, F on BC, G on BD, H on DA
+    darts = types == DART_ID
+    A, B, C, D = (vertices[darts, k] for k in range(4))
+    E = B + (A - B) * PHI_INV
+    F = B + (C - B) * PHI_INV
+    G = B + (D - B) * PHI_INV
+    H = D + (A - D) * PHI_INV
+    children[darts] = np.stack([np.stack([B, E, G, F], axis=1),
+                                np.stack([D, H, C, F], axis=1),
+                                np.stack([D, H, A, E], axis=1)], axis=1)
+
+    # Both tile types deflate into one KITE followed by two DARTs
+    child_types = np.tile(np.array([KITE_ID, DART_ID, DART_ID], dtype=np.uint8), len(types))
+    return children.reshape((-1,) + vertices.shape[1:]), child_types
+
+# Every child vertex is a fixed affine combination of its parent's vertices,
+# so the level-k descendants of a tile only depend on the tile through its
+# 4 vertices. A template stores those descendants as weights over the parent's
+# vertices: deflating the one-hot "vertices" of a canonical tile gives an
+# (M, 4, 4) array whose rows, multiplied by the seed vertices, are the children.
+_template_cache = {}
+
+def deflation_template(tile_type, level):
+    """Returns (weights, types) for the level-k descendants of one tile type, cached per level."""
+    key = (tile_type, level)
+    if key not in _template_cache:
+        if level == 0:
+            weights = np.eye(4)[np.newaxis]
+            types = np.array([tile_type], dtype=np.uint8)
+        else:
+            weights, types = substitute_tiles_array(*deflation_template(tile_type, level - 1))
+        _template_cache[key] = (weights, types)
+    return _template_cache[key]
+
+def substitute_tiles_template(vertices, types, level):
+    """Deflates seed tiles `level` times by instancing the cached templates, one batched matmul per type."""
+    count = 3 ** level
+    children = np.empty((len(vertices), count, 4, 2), dtype=float)
+    child_types = np.empty((len(vertices), count), dtype=np.uint8)
+    for tile_type in (KITE_ID, DART_ID):
+        seeds = types == tile_type
+        weights, template_types = deflation_template(tile_type, level)
+        children[seeds] = np.einsum('mvk,nkd->nmvd', weights, vertices[seeds])
+        child_types[seeds] = template_types
+    return children.reshape(-1, 4, 2), child_types.reshape(-1)
+
+def visible_mask(vertices, viewport=VIEWPORT):
+    """True for tiles whose bounding box intersects the viewport."""
+    xmin, ymin, xmax, ymax = viewport
+    lo = vertices.min(axis=1)
+    hi = vertices.max(axis=1)
+    return (hi[:, 0] >= xmin) & (lo[:, 0] <= xmax) & (hi[:, 1] >= ymin) & (lo[:, 1] <= ymax)
+
+def clip_tiles(vertices, types, viewport=VIEWPORT):
+    """Drops the tiles whose bounding box lies outside the viewport."""
+    keep = visible_mask(vertices, viewport)
+    return vertices[keep], types[keep]
+
+def substitute_tiles_culled(vertices, types, iterations, viewport=VIEWPORT):
+    """Deflates `iterations` times, culling tiles outside the viewport before each round.
+
+    Every child vertex lies on a segment between two parent vertices, so the
+    descendants of a tile never leave its bounding box. A tile culled early
+    therefore has no visible descendants, and the result equals full deflation
+    followed by clip_tiles, in the same order.
+    """
+    vertices, types = clip_tiles(vertices, types, viewport)
+    for i in range(iterations):
+        vertices, types = clip_tiles(*substitute_tiles_array(vertices, types), viewport)
+    return vertices, types
+
+def weld_vertices(vertices, tolerance=WELD_TOLERANCE):
+    """Welds shared corners into (points, quads): a (V, 2) vertex table and (N, 4) int32 vertex IDs."""
+    flat = vertices.reshape(-1, 2)
+    keys = np.round(flat / tolerance).astype(np.int64)
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    return flat[first], inverse.reshape(-1, 4).astype(np.int32)
+
+def unique_edges(quads):
+    """The (E, 2) list of distinct edges of the welded quads, each stored low ID first."""
+    edges = np.stack([quads, np.roll(quads, -1, axis=1)], axis=2).reshape(-1, 2)
+    return np.unique(np.sort(edges, axis=1), axis=0)
+
 def draw_tiling(tiles, drawer):
     """Draws all tiles in the list using the Turtle."""
-    kite_color = "#336699"  # Blue
-    dart_color = "#E08F32"  # Orange
+    kite_color = KITE_COLOR
+    dart_color = DART_COLOR
     
     for tile in tiles:
         drawer.up()
@@ -195,39 +325,172 @@ def draw_tiling(tiles, drawer):
         drawer.goto(tile['vertices'][0]) # Close the shape
         drawer.end_fill()
 
+def draw_edges(points, edges, drawer, color="white"):
+    """Draws the outline of a welded tiling, every shared edge exactly once."""
+    drawer.pencolor(color)
+    for start, end in edges.tolist():
+        drawer.up()
+        drawer.goto(tuple(points[start]))
+        drawer.down()
+        drawer.goto(tuple(points[end]))
+
+def hex_to_rgb(color):
+    """Converts a '#RRGGBB' string to an (r, g, b) tuple."""
+    return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+
+def render_tiling_image(vertices, types, width=800, height=800, viewport=VIEWPORT):
+    """Rasterizes all kites and darts of the array store into an RGB image buffer."""
+    image = np.empty((height, width, 3), dtype=np.uint8)
+    image[:] = BACKGROUND
+    vertices, types = clip_tiles(vertices, types, viewport)
+    pixels = world_to_pixel(vertices, viewport, width, height)
+    fill_polygons(image, pixels[types == KITE_ID], hex_to_rgb(KITE_COLOR))
+    fill_polygons(image, pixels[types == DART_ID], hex_to_rgb(DART_COLOR))
+    return image
+
+# --- Streaming Export ---
+
+# Binary polygon format: a 16 byte header (magic, tile count) followed by
+# one packed record per tile.
+STREAM_MAGIC = b'PNRS\0\0\0\0'
+STREAM_RECORD = np.dtype([('type', np.uint8), ('vertices', '<f4', (4, 2))])
+
+def iter_tile_chunks(vertices, types, iterations, chunk_level=CHUNK_LEVEL):
+    """Yields (vertices, types) chunks of the deflated tiling, walking the substitution tree depth-first.
+
+    Only the pending siblings along the current path are kept, so peak memory
+    is O(iterations + 3**chunk_level) instead of O(3**iterations). Chunks come
+    out in the same order as substitute_tiles_array would produce the tiles.
+    """
+    chunk_level = min(chunk_level, iterations)
+    stack = [(vertices[i:i + 1], types[i:i + 1], 0) for i in reversed(range(len(types)))]
+    while stack:
+        node_vertices, node_types, level = stack.pop()
+        if level == iterations - chunk_level:
+            yield substitute_tiles_template(node_vertices, node_types, chunk_level)
+            continue
+        child_vertices, child_types = substitute_tiles_array(node_vertices, node_types)
+        for i in reversed(range(3)):
+            stack.append((child_vertices[i:i + 1], child_types[i:i + 1], level + 1))
+
+def iter_leaf_tiles(vertices, types, iterations, chunk_level=CHUNK_LEVEL):
+    """Yields the finished (type, (4, 2) vertices) leaf tiles one at a time."""
+    for chunk_vertices, chunk_types in iter_tile_chunks(vertices, types, iterations, chunk_level):
+        yield from zip(chunk_types.tolist(), chunk_vertices)
+
+def svg_path_data(vertices):
+    """One SVG path 'd' string drawing every quad in the array as a closed subpath."""
+    coords = vertices.reshape(-1, 8)
+    return ''.join('M%.3f %.3fL%.3f %.3fL%.3f %.3fL%.3f %.3fZ' % tuple(quad) for quad in coords.tolist())
+
+def write_svg_stream(path, chunks, bounds, stroke_width=0):
+    """Writes chunks of tiles to an SVG file, one path per tile type per chunk."""
+    xmin, ymin, xmax, ymax = bounds
+    colors = {KITE_ID: KITE_COLOR, DART_ID: DART_COLOR}
+    with open(path, 'w') as svg:
+        # Flip y so the file matches the turtle's y-up orientation
+        svg.write(f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{xmin} {-ymax} {xmax - xmin} {ymax - ymin}">\n')
+        svg.write('<g transform="scale(1,-1)">\n')
+        for chunk_vertices, chunk_types in chunks:
+            for tile_type, color in colors.items():
+                selected = chunk_vertices[chunk_types == tile_type]
+                if len(selected):
+                    svg.write(f'<path fill="{color}" stroke="{color}" stroke-width="{stroke_width}" '
+                              f'd="{svg_path_data(selected)}"/>\n')
+        svg.write('</g>\n</svg>\n')
+
+def write_polygon_stream(path, chunks):
+    """Writes chunks of tiles to the binary polygon format and returns the tile count."""
+    count = 0
+    with open(path, 'wb') as out:
+        out.write(STREAM_MAGIC + np.uint64(0).tobytes())
+        for chunk_vertices, chunk_types in chunks:
+            records = np.empty(len(chunk_types), dtype=STREAM_RECORD)
+            records['type'] = chunk_types
+            records['vertices'] = chunk_vertices
+            out.write(records.tobytes())
+            count += len(records)
+        # Patch the tile count into the header now that it is known
+        out.seek(len(STREAM_MAGIC))
+        out.write(np.uint64(count).tobytes())
+    return count
+
+def read_polygon_stream(path):
+    """Memory-maps a binary polygon file as (vertices, types) without loading it."""
+    with open(path, 'rb') as stream:
+        header = stream.read(len(STREAM_MAGIC) + 8)
+    if header[:len(STREAM_MAGIC)] != STREAM_MAGIC:
+        raise ValueError(f"{path} is not a Penrose polygon stream")
+    count = int(np.frombuffer(header[len(STREAM_MAGIC):], dtype=np.uint64)[0])
+    records = np.memmap(path, dtype=STREAM_RECORD, mode='r', offset=len(header), shape=(count,))
+    return records['vertices'], records['type']
+
+def export_tiling(path, iterations, chunk_level=CHUNK_LEVEL):
+    """Streams a deep tiling of the initial 'sun' pattern to .svg or the binary polygon format."""
+    vertices, types = tiles_to_arrays(create_initial_kite())
+    chunks = iter_tile_chunks(vertices, types, iterations, chunk_level)
+    if path.endswith('.svg'):
+        # Descendants never leave their seed's bounding box
+        bounds = tuple(vertices.reshape(-1, 2).min(axis=0)) + tuple(vertices.reshape(-1, 2).max(axis=0))
+        write_svg_stream(path, chunks, bounds)
+    else:
+        write_polygon_stream(path, chunks)
+
+def save_tiling(path, vertices, types, viewport=VIEWPORT):
+    """Writes the tiling as a PNG image or as an SVG with a single path per tile type."""
+    if path.endswith('.svg'):
+        write_svg_stream(path, [clip_tiles(vertices, types, viewport)], viewport)
+    else:
+        write_png(path, render_tiling_image(vertices, types, viewport=viewport))
+
 # --- Main Execution ---
 
 def main():
-    # Setup the screen and turtle
+    # 1. Initialize the tiling with the initial 'sun' pattern
+    vertices, types = tiles_to_arrays(create_initial_kite())
+
+    # 2. Perform substitutions (deflation) on the array store
+    if DEFLATION_MODE == 'template':
+        vertices, types = substitute_tiles_template(vertices, types, ITERATIONS)
+        print(f"Iterations 1-{ITERATIONS}: {len(types)} tiles generated.")
+    elif DEFLATION_MODE == 'culled':
+        vertices, types = substitute_tiles_culled(vertices, types, ITERATIONS)
+        print(f"Iterations 1-{ITERATIONS}: {len(types)} visible tiles generated.")
+    else:
+        for i in range(ITERATIONS):
+            vertices, types = substitute_tiles_array(vertices, types)
+            print(f"Iteration {i+1}: {len(types)} tiles generated.")
+
+    # 3. Batched backend: write the whole tiling at once and skip the turtle
+    if RENDER_BACKEND == 'image':
+        save_tiling(OUTPUT_PATH, vertices, types)
+        print(f"Wrote {OUTPUT_PATH}")
+        return
+
+    # 4. Setup the screen and turtle
     screen = turtle.Screen()
     screen.setup(width=800, height=800)
     screen.title("Penrose Kite and Dart Tiling (Deflation Method)")
     screen.colormode(255) # Use RGB colors
     screen.bgcolor(20, 20, 20) # Dark background
-    
+
     drawer = turtle.Turtle()
     drawer.hideturtle()
     drawer.speed(DRAW_SPEED) # Set to maximum speed for drawing
 
-    # 1. Initialize the tiling with the initial 'sun' pattern
-    current_tiles = create_initial_kite()
-
-    # 2. Perform substitutions (deflation)
-    for i in range(ITERATIONS):
-        screen.tracer(0, 0) # Turn off screen updates for speed
-        current_tiles = substitute_tiles(current_tiles)
-        print(f"Iteration {i+1}: {len(current_tiles)} tiles generated.")
-        screen.tracer(1, 10) # Turn on updates briefly to show progress
-        
-    # 3. Draw the final set of tiles
+    # 5. Draw the final set of tiles
     screen.tracer(0, 0) # Turn off screen updates for final drawing
-    draw_tiling(current_tiles, drawer)
+    if OUTLINE_ONLY:
+        points, quads = weld_vertices(vertices)
+        draw_edges(points, unique_edges(quads), drawer)
+    else:
+        draw_tiling(arrays_to_tiles(vertices, types), drawer)
     screen.tracer(1, 10) # Turn on updates
     
     drawer.up()
     drawer.goto(0, 0)
     drawer.pencolor("white")
-    drawer.write(f"Penrose Tiling (Kites & Darts)\nIterations: {ITERATIONS} | Tiles: {len(current_tiles)}", 
+    drawer.write(f"Penrose Tiling (Kites & Darts)\nIterations: {ITERATIONS} | Tiles: {len(types)}", 
                  align="center", font=("Inter", 16, "bold"))
     
     screen.exitonclick()
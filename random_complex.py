@@ -2,6 +2,8 @@ import turtle
 from random import randint
 import math
 
+from recurrences import LinearRecurrence
+
 
 # Set up the screen
 turtle.screensize(canvwidth=10000, canvheight=10000, bg="white")
@@ -16,18 +18,8 @@ turtle.colormode(255)  # Enable RGB color mode
 skk.width(1)  # Set the pen width
 skk.goto(-150, -150)
 
-# Memoization for Fibonacci
-memo = {}
-
-def fibonacci(n):
-    if n in memo: 
-        return memo[n]
-    if n <= 2: 
-        f = 1
-    else: 
-        f = fibonacci(n-3) + fibonacci(n-5) + fibonacci(n-9) + fibonacci(n-7)
-    memo[n] = f 
-    return f
+# Custom Fibonacci-like recurrence, evaluated by companion-matrix powers
+fibonacci = LinearRecurrence((3, 5, 9, 7))
 
 # Number of sides and length of the star
 n = 37
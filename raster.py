@@ -0,0 +1,231 @@
+"""
+Small NumPy raster helpers shared by the scripts that render without turtle.
+
+Images are plain uint8 arrays: (height, width) for grayscale and
+(height, width, 3) for RGB, row 0 at the top. 1-bit images are 0/1 arrays
+in which 1 marks ink, drawn black on white. PNG files are written with zlib
+only, so no imaging library is needed.
+"""
+import struct
+import zlib
+
+import numpy as np
+
+# --- Image Output ---
+
+def _png_chunk(tag, data):
+    return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff)
+
+def write_png(path, image):
+    """Writes a (H, W) grayscale or (H, W, 3) RGB uint8 image as a PNG file."""
+    image = np.ascontiguousarray(image, dtype=np.uint8)
+    height, width = image.shape[:2]
+    color_type = 2 if image.ndim == 3 else 0
+    # Every scanline starts with filter type 0 (None)
+    rows = np.concatenate([np.zeros((height, 1), dtype=np.uint8), image.reshape(height, -1)], axis=1)
+    with open(path, 'wb') as png:
+        png.write(b'\x89PNG\r\n\x1a\n')
+        png.write(_png_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, color_type, 0, 0, 0)))
+        png.write(_png_chunk(b'IDAT', zlib.compress(rows.tobytes(), 6)))
+        png.write(_png_chunk(b'IEND', b''))
+
+def write_png_bits(path, bits):
+    """Writes a (H, W) 0/1 array as a 1-bit PNG, with 1 drawn black on white."""
+    bits = np.asarray(bits, dtype=bool)
+    height, width = bits.shape
+    # PNG grayscale uses 0 for black, and packs the leftmost pixel in the high bit
+    packed = np.packbits(~bits, axis=1)
+    rows = np.concatenate([np.zeros((height, 1), dtype=np.uint8), packed], axis=1)
+    with open(path, 'wb') as png:
+        png.write(b'\x89PNG\r\n\x1a\n')
+        png.write(_png_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 1, 0, 0, 0, 0)))
+        png.write(_png_chunk(b'IDAT', zlib.compress(rows.tobytes(), 6)))
+        png.write(_png_chunk(b'IEND', b''))
+
+def write_pbm(path, bits):
+    """Writes a (H, W) 0/1 array as a binary (P4) PBM, with 1 drawn black on white."""
+    bits = np.asarray(bits, dtype=bool)
+    height, width = bits.shape
+    with open(path, 'wb') as pbm:
+        pbm.write(f"P4\n{width} {height}\n".encode('ascii'))
+        pbm.write(np.packbits(bits, axis=1).tobytes())
+
+def scale_image(image, scale):
+    """Enlarges an image by an integer factor, one block of pixels per source pixel."""
+    if scale == 1:
+        return image
+    return np.repeat(np.repeat(image, scale, axis=0), scale, axis=1)
+
+# --- Geometry ---
+
+def world_to_pixel(points, viewport, width, height):
+    """Maps (..., 2) world coordinates in viewport (xmin, ymin, xmax, ymax) to pixel coordinates, y down."""
+    xmin, ymin, xmax, ymax = viewport
+    pixels = np.empty(points.shape, dtype=float)
+    pixels[..., 0] = (points[..., 0] - xmin) * (width / (xmax - xmin))
+    pixels[..., 1] = (ymax - points[..., 1]) * (height / (ymax - ymin))
+    return pixels
+
+def fill_polygons(image, polygons, color, batch=1 << 22):
+    """Fills (N, K, 2) pixel-space polygons into the image with the even-odd rule.
+
+    Every polygon is expanded into the pixels of its bounding box, and all of
+    them are tested against the polygon edges at once. Pixels are sampled at
+    their centers, and at most `batch` candidate pixels are held at a time.
+    """
+    height, width = image.shape[:2]
+    lo = np.clip(np.floor(polygons.min(axis=1) - 0.5).astype(np.int64) + 1, 0, [width, height])
+    hi = np.clip(np.floor(polygons.max(axis=1) - 0.5).astype(np.int64) + 1, 0, [width, height])
+    size = hi - lo
+    counts = size[:, 0] * size[:, 1]
+    ends = np.cumsum(counts)
+    start = 0
+    while start < len(polygons):
+        # Take as many polygons as fit in the candidate budget, at least one
+        base = ends[start - 1] if start else 0
+        stop = max(start + 1, int(np.searchsorted(ends, base + batch, side='right')))
+        _fill_batch(image, polygons[start:stop], lo[start:stop], size[start:stop], counts[start:stop], color)
+        start = stop
+
+def _fill_batch(image, polygons, lo, size, counts, color):
+    owner = np.repeat(np.arange(len(polygons)), counts)
+    if not len(owner):
+        return
+    local = np.arange(len(owner)) - np.repeat(np.cumsum(counts) - counts, counts)
+    px = lo[owner, 0] + local % size[owner, 0]
+    py = lo[owner, 1] + local // size[owner, 0]
+    x = px + 0.5
+    y = py + 0.5
+    inside = np.zeros(len(owner), dtype=bool)
+    corners = polygons.shape[1]
+    for k in range(corners):
+        x0, y0 = polygons[owner, k, 0], polygons[owner, k, 1]
+        x1, y1 = polygons[owner, (k + 1) % corners, 0], polygons[owner, (k + 1) % corners, 1]
+        crosses = (y0 > y) != (y1 > y)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_cross = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
+        inside ^= crosses & (x < x_cross)
+    image[py[inside], px[inside]] = color
+
+def draw_segments(image, starts, ends, colors, batch=1 << 22):
+    """Draws (N, 2) pixel-space line segments, one pixel per step along the major axis.
+
+    `colors` is one color for all segments or one color per segment. All
+    segments are sampled at once, at most `batch` samples at a time, and
+    later segments overwrite earlier ones.
+    """
+    height, width = image.shape[:2]
+    colors = np.asarray(colors)
+    per_segment = colors.ndim == image.ndim - 1
+    delta = ends - starts
+    samples = np.ceil(np.abs(delta).max(axis=1)).astype(np.int64) + 1
+    ends_at = np.cumsum(samples)
+    start = 0
+    while start < len(starts):
+        base = ends_at[start - 1] if start else 0
+        stop = max(start + 1, int(np.searchsorted(ends_at, base + batch, side='right')))
+        counts = samples[start:stop]
+        owner = np.repeat(np.arange(start, stop), counts)
+        local = np.arange(len(owner)) - np.repeat(np.cumsum(counts) - counts, counts)
+        fraction = local / np.maximum(samples[owner] - 1, 1)
+        points = starts[owner] + delta[owner] * fraction[:, np.newaxis]
+        px = np.floor(points[:, 0]).astype(np.int64)
+        py = np.floor(points[:, 1]).astype(np.int64)
+        inside = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+        image[py[inside], px[inside]] = colors[owner[inside]] if per_segment else colors
+        start = stop
+
+def draw_segments_aa(image, starts, ends, colors, widths=1.0, batch=1 << 20):
+    """Draws antialiased (N, 2) pixel-space segments of the given widths into an RGB image.
+
+    Strokes have round caps, like Tk lines, so a zero-length segment is a
+    dot as wide as the stroke. Every segment is walked one pixel column at a
+    time along its major axis, and only the few pixels per column that the
+    stroke can reach are visited. Each of them gets one coverage value from
+    its center, clip(width / 2 + 0.5 - distance to the segment, 0, 1).
+    Segments with the same number of columns and rows are evaluated together
+    as one (segments, columns, rows) block, at most `batch` pixels at a time.
+    Colors are averaged by coverage and composited over the image at the
+    end, so overlapping strokes blend instead of depending on draw order.
+    """
+    height, width = image.shape[:2]
+    count = len(starts)
+    colors = np.broadcast_to(np.asarray(colors, dtype=float), (count, 3))
+    radius = np.broadcast_to(np.asarray(widths, dtype=float), (count,)) / 2 + 0.5
+    # Work in (major, minor) axis coordinates, ordered so every segment runs forward along its major axis
+    steep = np.abs(ends[:, 1] - starts[:, 1]) > np.abs(ends[:, 0] - starts[:, 0])
+    a0 = np.where(steep, starts[:, 1], starts[:, 0])
+    a1 = np.where(steep, ends[:, 1], ends[:, 0])
+    b0 = np.where(steep, starts[:, 0], starts[:, 1])
+    b1 = np.where(steep, ends[:, 0], ends[:, 1])
+    flip = a1 < a0
+    a0, a1 = np.where(flip, a1, a0), np.where(flip, a0, a1)
+    b0, b1 = np.where(flip, b1, b0), np.where(flip, b0, b1)
+    da = a1 - a0
+    db = b1 - b0
+    slope = np.divide(db, da, out=np.zeros(count), where=da > 0)
+    inverse_length2 = 1.0 / np.maximum(da * da + db * db, 1e-12)
+    # Columns whose centers can lie within `radius` of the segment, limited to the image
+    first = np.maximum(np.ceil(a0 - radius - 0.5), 0).astype(np.int64)
+    last = np.minimum(np.floor(a1 + radius - 0.5), np.where(steep, height, width) - 1).astype(np.int64)
+    columns = np.maximum(last - first + 1, 0)
+    # In each column the stroke stays within `span` of the line, so `depth` rows cover it
+    span = radius * np.sqrt(1 + slope * slope)
+    depth = np.floor(2 * span).astype(np.int64) + 1
+    rows_in_image = np.where(steep, width, height)
+    # Short segments are grouped by their exact column count, long ones by the next power of two
+    block = np.where(columns <= 32, columns, 1 << np.ceil(np.log2(np.maximum(columns, 1))).astype(np.int64))
+    key = block * (depth.max(initial=1) + 1) + depth
+    order = np.argsort(key, kind='stable')
+    order = order[columns[order] > 0]
+    bounds = np.flatnonzero(np.diff(key[order])) + 1
+
+    coverage = np.zeros(height * width)
+    color_sum = np.zeros((3, height * width))
+    for group in np.split(order, bounds):
+        if not len(group):
+            continue
+        cols, rows = int(block[group[0]]), int(depth[group[0]])
+        step = max(1, batch // (cols * rows))
+        for chunk in range(0, len(group), step):
+            g = group[chunk:chunk + step]
+            column = first[g][:, np.newaxis] + np.arange(cols)
+            pa = column + 0.5 - a0[g][:, np.newaxis]
+            row0 = np.ceil(slope[g][:, np.newaxis] * pa + (b0[g] - span[g] - 0.5)[:, np.newaxis])
+            # Offsets from the segment start are small, so single precision is plenty from here on
+            pb = (row0 + 0.5 - b0[g][:, np.newaxis]).astype(np.float32)
+            pa = pa.astype(np.float32)
+            seg_a = da[g].astype(np.float32)[:, np.newaxis]
+            seg_b = db[g].astype(np.float32)[:, np.newaxis]
+            inverse = inverse_length2[g].astype(np.float32)[:, np.newaxis]
+            k = np.arange(rows, dtype=np.float32)
+            # Position along the segment of each pixel's nearest point, t0 for the column's first row
+            t0 = (pa * seg_a + pb * seg_b) * inverse
+            t = np.clip(t0[:, :, np.newaxis] + (seg_b * inverse)[:, :, np.newaxis] * k, 0, 1)
+            off_a = pa[:, :, np.newaxis] - t * seg_a[:, :, np.newaxis]
+            off_b = pb[:, :, np.newaxis] + k - t * seg_b[:, :, np.newaxis]
+            weight = np.clip(radius[g].astype(np.float32)[:, np.newaxis, np.newaxis]
+                             - np.sqrt(off_a * off_a + off_b * off_b), 0, 1)
+            # Rows outside the image, and padding columns of a power-of-two block, get no weight
+            row_first = row0.astype(np.int64)
+            low = -row_first
+            high = rows_in_image[g][:, np.newaxis] - row_first
+            if cols != columns[g].min():
+                high = np.where(np.arange(cols) < columns[g][:, np.newaxis], high, 0)
+            weight *= (k >= low[:, :, np.newaxis]) & (k < high[:, :, np.newaxis])
+            is_steep = steep[g][:, np.newaxis]
+            base = np.where(is_steep, column * width + row_first, row_first * width + column)
+            stride = np.where(is_steep, 1, width)[:, :, np.newaxis]
+            pixel = np.clip(base[:, :, np.newaxis] + stride * np.arange(rows), 0, height * width - 1).ravel()
+            weight = weight.reshape(len(g), -1)
+            coverage += np.bincount(pixel, weight.ravel(), minlength=height * width)
+            for channel in range(3):
+                channel_weight = weight * colors[g, channel].astype(np.float32)[:, np.newaxis]
+                color_sum[channel] += np.bincount(pixel, channel_weight.ravel(), minlength=height * width)
+
+    covered = coverage > 0
+    alpha = np.minimum(coverage[covered], 1.0)[:, np.newaxis]
+    mean = (color_sum[:, covered] / coverage[covered]).T
+    flat = image.reshape(-1, 3)
+    flat[covered] = np.rint(flat[covered] * (1 - alpha) + mean * alpha).astype(np.uint8)
+    return image
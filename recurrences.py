@@ -0,0 +1,140 @@
+"""
+Shared Fibonacci and recurrence helpers for the spirograph scripts.
+
+Every function here is iterative, so deep indices never hit Python's
+recursion limit, and results are exact Python ints of any size.
+fibonacci() uses fast doubling, which takes O(log n) big-integer
+multiplications, and keeps recent results in one bounded cache shared by
+every script that imports it.
+
+Indexing follows the scripts: F(0) = 0, F(1) = F(2) = 1.
+
+LinearRecurrence covers the custom lag recurrences of module4.py,
+module5.py and friends, f(n) = f(n - a) + f(n - b) + ..., by raising
+their companion matrix to the nth power.
+"""
+import math
+from functools import lru_cache
+
+import numpy as np
+
+FIB_CACHE_SIZE = 4096  # Most recently used fibonacci() results kept in the shared cache
+
+# --- Fibonacci ---
+
+def _fib_pair(n):
+    """(F(n), F(n + 1)) by fast doubling over the bits of n, most significant first."""
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        # F(2k) = F(k) * (2 F(k + 1) - F(k)),  F(2k + 1) = F(k)^2 + F(k + 1)^2
+        a, b = a * (2 * b - a), a * a + b * b
+        if bit == '1':
+            a, b = b, a + b
+    return a, b
+
+@lru_cache(maxsize=FIB_CACHE_SIZE)
+def fibonacci(n):
+    """The nth Fibonacci number, exact for any integer n (F(-n) = (-1)**(n + 1) F(n))."""
+    n = int(n)
+    if n < 0:
+        value = fibonacci(-n)
+        return value if n % 2 else -value
+    return _fib_pair(n)[0]
+
+def fibonacci_iterative(n):
+    """The nth Fibonacci number by n additions, for small n or checking fibonacci()."""
+    a, b = 0, 1
+    for i in range(int(n)):
+        a, b = b, a + b
+    return a
+
+def fibonacci_list(count, start=0):
+    """The `count` Fibonacci numbers F(start), F(start + 1), ... as a list."""
+    if count <= 0:
+        return []
+    a, b = _fib_pair(start)
+    values = [a]
+    for i in range(count - 1):
+        a, b = b, a + b
+        values.append(a)
+    return values
+
+# --- Generalized Lag Recurrences ---
+
+def _mat_mul(a, b):
+    """Product of two square matrices of exact ints, as lists of rows."""
+    columns = list(zip(*b))
+    return [[sum(x * y for x, y in zip(row, column)) for column in columns] for row in a]
+
+class LinearRecurrence:
+    """f(n) = sum of f(n - lag) over `lags` for n > threshold, and f(n) = base for n <= threshold.
+
+    The scripts' memoized versions, e.g. f(n-3) + f(n-5) + f(n-9) + f(n-7) with
+    f(n) = 1 for n <= 2, become LinearRecurrence((3, 5, 9, 7)). The state
+    (f(n), f(n-1), ..., f(n-k+1)) advances by one step through a k x k companion
+    matrix C, so f(n) is read off C**(n - threshold) applied to the base state,
+    in O(k**3 log n) exact integer operations. Squarings of C are cached, so
+    evaluating many n shares them.
+
+    Non-integer indices: the recursive versions only ever subtract integer
+    lags and stop once the index drops to the threshold, so f(x) equals
+    f(ceil(x)) for every real x. Indices are mapped to ceil(x) before
+    evaluation, which gives the same values as the recursion and keeps
+    nothing per distinct float index.
+    """
+
+    def __init__(self, lags, base=1, threshold=2):
+        self.lags = tuple(int(lag) for lag in lags)
+        if not self.lags or min(self.lags) < 1:
+            raise ValueError(f"lags must be positive integers, got {lags}")
+        self.base = base
+        self.threshold = threshold
+        self.order = max(self.lags)
+        companion = [[0] * self.order for i in range(self.order)]
+        for lag in self.lags:
+            companion[0][lag - 1] += 1
+        for i in range(1, self.order):
+            companion[i][i - 1] = 1
+        self._powers = [companion]  # C**(2**j)
+
+    def _power(self, exponent):
+        """Companion matrix to the given power, from cached repeated squarings."""
+        result = None
+        j = 0
+        while exponent:
+            if j == len(self._powers):
+                self._powers.append(_mat_mul(self._powers[-1], self._powers[-1]))
+            if exponent & 1:
+                result = self._powers[j] if result is None else _mat_mul(result, self._powers[j])
+            exponent >>= 1
+            j += 1
+        return result
+
+    def __call__(self, n):
+        """f(n) as an exact int, for any real n."""
+        steps = math.ceil(n) - self.threshold
+        if steps <= 0:
+            return self.base
+        # Every entry of the base state equals `base`, so f(n) is the first row sum times base
+        return sum(self._power(steps)[0]) * self.base
+
+    def terms(self, ns):
+        """f(n) for an array of indices, as an object array of exact ints with the same shape.
+
+        Dense ranges are filled by running the recurrence forward once, and
+        sparse large indices use the cached matrix powers.
+        """
+        ns = np.asarray(ns)
+        steps = np.ceil(ns).astype(np.int64) - self.threshold if ns.size else np.zeros(0, dtype=np.int64)
+        unique = np.unique(steps[steps > 0])
+        if len(unique) and unique[-1] <= 64 * len(unique):
+            table = [self.base] * self.order
+            for step in range(1, int(unique[-1]) + 1):
+                table.append(sum(table[-lag] for lag in self.lags))
+            values = {int(step): table[self.order - 1 + int(step)] for step in unique}
+        else:
+            values = {int(step): sum(self._power(int(step))[0]) * self.base for step in unique}
+        result = np.empty(ns.shape, dtype=object)
+        for index, step in np.ndenumerate(steps):
+            result[index] = values[int(step)] if step > 0 else self.base
+        return result
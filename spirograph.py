@@ -1,22 +1,15 @@
 from turtle import * 
+
+from frame_batch import FrameBatch
+from recurrences import fibonacci
+from trochoids import turtle_star
+
 screensize(canvwidth=7680, canvheight=4800, bg='black')
-def fibonacci(n):
-    fibo = []
-    for i in range(n): 
-        if i == 0 or i == 1:
-            fibo.append(i)
-        else:
-            f = fibo.append(fibo[i-1] + fibo[i-2])
-    fibo[n] = f 
-    return f
 def sprirograph(fibonacci):     
-    for i in range(13):
-        color('red') 
-        for i in range (37):
-            if i==13 or i == 55:
-                forward(13) 
-            forward(55)
-            left(13)
-        left(55)
-while True: 
+    # One exact period of the (13, 55) star: 45 blocks of 38 moves (37 steps plus the extra forward(13)), 1710 segments
+    color('red') 
+    for x, y in turtle_star(13, 55)[1:].tolist():
+        goto(x, y)
+with FrameBatch():
     sprirograph(fibonacci)
+done()
@@ -0,0 +1,103 @@
+"""
+Streaming, viewport-clipped square spirals.
+
+arcesoftware.fib draws the spiral forward(i), right(90) for i in
+range(count). With count = fibonacci(50) that is 12.6 billion segments,
+and almost all of them lie far outside the window. Measured from the
+spiral's own start and heading, the vertices have a closed form. Group k
+(segments 4k..4k+3, heading east, south, west, north) starts at (-2k, 2k),
+and every segment of a given direction lies on a line whose position is
+linear in k:
+
+    east   4k      y = 2k        x from -2k to 2k
+    south  4k + 1  x = 2k        y from 2k to -2k - 1
+    west   4k + 2  y = -2k - 1   x from 2k to -2k - 2
+    north  4k + 3  x = -2k - 2   y from -2k - 1 to 2k + 2
+
+The groups whose segments cross the viewport therefore form one
+contiguous k range per direction, found by solving linear inequalities.
+square_spiral() yields only those segments, clipped and in drawing order,
+and skips everything else analytically. Time and memory depend on the
+viewport size, not on count.
+"""
+import heapq
+import math
+
+# (fixed-coordinate axis, direction along the other axis, fixed = a k + b, from = p k + q, to = r k + s)
+_SEGMENTS = (
+    (1, (1, 0), (2, 0), (-2, 0), (2, 0)),      # east
+    (0, (0, -1), (2, 0), (2, 0), (-2, -1)),    # south
+    (1, (-1, 0), (-2, -1), (2, 0), (-2, -2)),  # west
+    (0, (0, 1), (-2, -2), (-2, -1), (2, 2)),   # north
+)
+
+def _rotate(x, y, quarter_turns):
+    """(x, y) rotated counterclockwise by quarter_turns * 90 degrees, exactly."""
+    for i in range(quarter_turns % 4):
+        x, y = -y, x
+    return x, y
+
+def _quarter_turns(heading):
+    turns = heading / 90.0
+    if turns != round(turns):
+        raise ValueError(f"square spirals need a heading that is a multiple of 90 degrees, got {heading}")
+    return int(round(turns)) % 4
+
+def _k_range(constraints, k_max):
+    """Integers 0 <= k <= k_max with c * k + d >= 0 for every (c, d)."""
+    low, high = 0, k_max
+    for c, d in constraints:
+        if c > 0:
+            low = max(low, math.ceil(-d / c))
+        elif c < 0:
+            high = min(high, math.floor(d / -c))
+        elif d < 0:
+            return range(0)
+    return range(low, high + 1)
+
+def _direction_segments(kind, count, box, turns, start):
+    axis, step, (a, b), (p, q), (r, s) = _SEGMENTS[kind]
+    fixed_lo, fixed_hi = box[axis], box[axis + 2]
+    free_lo, free_hi = box[1 - axis], box[3 - axis]
+    along = step[1 - axis]
+    # Coordinates of the segment's own start and end, lowest and highest along the free axis
+    lo_c, lo_d, hi_c, hi_d = (p, q, r, s) if along > 0 else (r, s, p, q)
+    constraints = [(a, b - fixed_lo), (-a, fixed_hi - b), (hi_c, hi_d - free_lo), (-lo_c, free_hi - lo_d)]
+    if count <= kind:
+        return
+    for k in _k_range(constraints, (count - 1 - kind) // 4):
+        index = 4 * k + kind
+        if index == 0:
+            continue  # forward(0) draws nothing
+        fixed = a * k + b
+        begin = min(max(p * k + q, free_lo), free_hi)
+        end = min(max(r * k + s, free_lo), free_hi)
+        points = []
+        for free in (begin, end):
+            x, y = (free, fixed) if axis == 1 else (fixed, free)
+            x, y = _rotate(x, y, turns)
+            points.append((start[0] + x, start[1] + y))
+        yield index, points[0], points[1]
+
+def square_spiral(count, viewport, start=(0, 0), heading=0):
+    """Yields (index, (x0, y0), (x1, y1)) for the parts of segments 0..count-1 inside the viewport.
+
+    `viewport` is (xmin, ymin, xmax, ymax) in turtle coordinates. The spiral
+    starts at `start` with `heading` in degrees, which must be a multiple
+    of 90 degrees, and turns right after every segment.
+    """
+    turns = _quarter_turns(heading)
+    corners = [_rotate(x - start[0], y - start[1], -turns)
+               for x in (viewport[0], viewport[2]) for y in (viewport[1], viewport[3])]
+    xs, ys = zip(*corners)
+    box = (min(xs), min(ys), max(xs), max(ys))
+    streams = [_direction_segments(kind, count, box, turns, start) for kind in range(4)]
+    yield from heapq.merge(*streams)
+
+def square_spiral_end(count, start=(0, 0), heading=0):
+    """(x, y, heading) of the turtle after drawing `count` segments, in closed form."""
+    turns = _quarter_turns(heading)
+    k, kind = divmod(count, 4)
+    x, y = ((-2 * k, 2 * k), (2 * k, 2 * k), (2 * k, -2 * k - 1), (-2 * k - 2, -2 * k - 1))[kind]
+    x, y = _rotate(x, y, turns)
+    return start[0] + x, start[1] + y, (heading - 90 * count) % 360
@@ -0,0 +1,94 @@
+"""
+Multi-resolution store for very long attractor trajectories.
+
+The raw trajectory is written to a memory-mapped .npy file chunk by chunk as
+it comes out of the integrator (lorenz_integrator.iter_trajectory or
+TrajectoryCache.iter_chunks). Level k then summarizes every FACTOR**k
+consecutive states as one bin holding the per-coordinate minimum, the
+maximum and a decimated sample (the bin's first state), stored as a
+(bins, 3, dim) array. Each level is built from the one below it in blocks,
+so memory stays bounded however long the run is.
+
+A viewer asks for a time window and the number of pixels it has to fill.
+It gets the coarsest level that still has at least one bin per pixel, so
+an overview costs O(pixels) instead of O(steps).
+"""
+import json
+import os
+
+import numpy as np
+
+FACTOR = 8         # States per bin grow by this factor from one level to the next
+MIN_BINS = 1024    # Levels stop once they would have fewer bins than this
+BLOCK = 1 << 20    # Rows processed at a time while building levels
+MIN, MAX, SAMPLE = 0, 1, 2
+
+def _level_path(directory, level):
+    return os.path.join(directory, "raw.npy" if level == 0 else f"level{level}.npy")
+
+def build_pyramid(directory, chunks, count, dim, factor=FACTOR, min_bins=MIN_BINS):
+    """Streams `count` states from `chunks` into a pyramid in `directory` and returns it."""
+    os.makedirs(directory, exist_ok=True)
+    raw = np.lib.format.open_memmap(_level_path(directory, 0), mode='w+', dtype=float, shape=(count, dim))
+    start = 0
+    for block in chunks:
+        block = block[:count - start]
+        raw[start:start + len(block)] = block
+        start += len(block)
+        if start == count:
+            break
+    raw.flush()
+    if start != count:
+        raise ValueError(f"chunks ended after {start} of {count} states")
+
+    # Level 0 doubles as its own min, max and sample, so level 1 reads raw rows directly
+    below, levels = raw, 0
+    while -(-len(below) // factor) >= min_bins:
+        levels += 1
+        bins = -(-len(below) // factor)
+        level = np.lib.format.open_memmap(_level_path(directory, levels), mode='w+', dtype=float,
+                                          shape=(bins, 3, dim))
+        step = BLOCK // factor * factor
+        for first in range(0, len(below), step):
+            rows = np.asarray(below[first:first + step])
+            if rows.ndim == 2:
+                rows = np.stack([rows, rows, rows], axis=1)
+            out = slice(first // factor, first // factor + -(-len(rows) // factor))
+            starts = np.arange(0, len(rows), factor)
+            level[out, MIN] = np.minimum.reduceat(rows[:, MIN], starts, axis=0)
+            level[out, MAX] = np.maximum.reduceat(rows[:, MAX], starts, axis=0)
+            level[out, SAMPLE] = rows[starts, SAMPLE]
+        level.flush()
+        below = level
+
+    with open(os.path.join(directory, "pyramid.json"), 'w') as meta:
+        json.dump({'count': count, 'dim': dim, 'factor': factor, 'levels': levels}, meta)
+    return TrajectoryPyramid(directory)
+
+class TrajectoryPyramid:
+    """Read access to a trajectory pyramid built by build_pyramid."""
+
+    def __init__(self, directory):
+        with open(os.path.join(directory, "pyramid.json")) as meta:
+            info = json.load(meta)
+        self.count = info['count']
+        self.dim = info['dim']
+        self.factor = info['factor']
+        self.raw = np.load(_level_path(directory, 0), mmap_mode='r')
+        self.levels = [np.load(_level_path(directory, k), mmap_mode='r') for k in range(1, info['levels'] + 1)]
+
+    def level_for(self, start, stop, pixels):
+        """Coarsest level with at least one bin per pixel over states start..stop-1 (0 is raw)."""
+        level = 0
+        while level < len(self.levels) and (stop - start) // self.factor ** (level + 1) >= pixels:
+            level += 1
+        return level
+
+    def fetch(self, start=0, stop=None, pixels=2048):
+        """Returns (level, data) for a time window: raw (n, dim) states or (bins, 3, dim) summaries."""
+        stop = self.count if stop is None else stop
+        level = self.level_for(start, stop, pixels)
+        if level == 0:
+            return 0, np.asarray(self.raw[start:stop])
+        size = self.factor ** level
+        return level, np.asarray(self.levels[level - 1][start // size:-(-stop // size)])
@@ -0,0 +1,119 @@
+"""
+Closed-form spirograph curves with exact closure periods.
+
+Hypotrochoids and epitrochoids with radii R and r close after
+r / gcd(R, r) turns of the parameter, so one full figure is a single
+vectorized evaluation over that range. Rational radii work too, because the
+ratio is reduced with Fraction.
+
+The turtle stars of spirograph.py, Tourus.py and watch.py repeat a block of
+moves, forward(l), left(n) done 37 times and then left(l). If a block turns
+the turtle by theta degrees, the figure closes after the denominator of
+theta / 360, reduced, blocks. For example (n, l) = (13, 55) turns 536 degrees
+per block and closes after 45 blocks. The block is evaluated once with
+cumulative headings, and the rotated copies and their start points come
+from one outer product, so a period costs O(points) with no stepping.
+"""
+import math
+from fractions import Fraction
+
+import numpy as np
+
+SAMPLES_PER_TURN = 360  # Curve points per 2*pi of the rolling parameter
+STAR_STEPS = 37         # forward/left moves per block in the turtle stars
+MAX_PERIOD = 100000     # Longest period, in blocks or turns, that is still generated
+
+# --- Period Analysis ---
+
+def trochoid_turns(R, r):
+    """Parameter turns (multiples of 2*pi) before a trochoid with radii R, r closes."""
+    ratio = Fraction(R) / Fraction(r)
+    return ratio.denominator
+
+def star_period(turns, lengths=None):
+    """Repeats of a block of turtle moves before it closes, from its total turn in degrees.
+
+    Angles are taken as exact Fractions. A block with no net turn closes after
+    one repeat only if it also ends where it started; otherwise it drifts and
+    never closes, and ValueError is raised.
+    """
+    total = sum((Fraction(turn) for turn in turns), Fraction(0))
+    period = (total / 360 % 1).denominator
+    if total % 360 == 0 and lengths is not None:
+        end = _block_points(lengths, turns)[-1]
+        if abs(end) > 1e-9 * (1 + float(np.sum(np.abs(lengths)))):
+            raise ValueError("block has no net turn and does not return to its start, so it never closes")
+    if period > MAX_PERIOD:
+        raise ValueError(f"path closes only after {period} repeats (more than {MAX_PERIOD})")
+    return period
+
+# --- Trochoids ---
+
+def _trochoid(R, r, d, sign, samples_per_turn):
+    turns = trochoid_turns(R, r)
+    if turns > MAX_PERIOD:
+        raise ValueError(f"curve closes only after {turns} turns (more than {MAX_PERIOD})")
+    t = np.linspace(0.0, 2 * math.pi * turns, turns * samples_per_turn + 1)
+    k = (R + sign * r) / r
+    x = (R + sign * r) * np.cos(t) - sign * d * np.cos(k * t)
+    y = (R + sign * r) * np.sin(t) - d * np.sin(k * t)
+    return np.stack([x, y], axis=1)
+
+def hypotrochoid(R, r, d, samples_per_turn=SAMPLES_PER_TURN):
+    """(N, 2) points of one closed period of the hypotrochoid (circle r rolling inside R, pen at d)."""
+    return _trochoid(float(R), float(r), float(d), -1, samples_per_turn)
+
+def epitrochoid(R, r, d, samples_per_turn=SAMPLES_PER_TURN):
+    """(N, 2) points of one closed period of the epitrochoid (circle r rolling outside R, pen at d)."""
+    return _trochoid(float(R), float(r), float(d), 1, samples_per_turn)
+
+# --- Turtle Stars ---
+
+def star_block(n, l, steps=STAR_STEPS):
+    """(lengths, turns) of one block of the scenes' star loop, as forward-then-left moves.
+
+    Mirrors
+        for i in range(steps):
+            if i == n or i == l:
+                forward(n)
+            forward(l)
+            left(n)
+        left(l)
+    """
+    lengths, turns = [], []
+    for i in range(steps):
+        if i == n or i == l:
+            lengths.append(n)
+            turns.append(0)
+        lengths.append(l)
+        turns.append(n)
+    turns[-1] += l
+    return lengths, turns
+
+def _block_points(lengths, turns):
+    """Complex positions after each move of a block started at 0 heading east."""
+    headings = np.radians(np.concatenate([[0.0], np.cumsum(np.asarray(turns, dtype=float))[:-1]]))
+    return np.cumsum(np.asarray(lengths, dtype=float) * np.exp(1j * headings))
+
+def turtle_path(lengths, turns, start=(0.0, 0.0), heading=0.0, repeats=None):
+    """(N, 2) vertices, start included, of a block of moves repeated until it closes.
+
+    `repeats` defaults to the exact period from star_period. Each copy of
+    the block is the first one rotated by the block's net turn and shifted
+    to the previous copy's end.
+    """
+    repeats = star_period(turns, lengths) if repeats is None else repeats
+    block = _block_points(lengths, turns)
+    spin = np.exp(1j * math.radians(float(sum(Fraction(turn) for turn in turns) % 360)))
+    rotations = spin ** np.arange(repeats)
+    # Copy j starts where copies 0..j-1 together end
+    offsets = np.concatenate([[0.0], np.cumsum(rotations[:-1] * block[-1])])
+    points = offsets[:, np.newaxis] + rotations[:, np.newaxis] * block[np.newaxis, :]
+    points = np.concatenate([[0.0], points.ravel()]) * np.exp(1j * math.radians(heading))
+    points += complex(*start)
+    return np.stack([points.real, points.imag], axis=1)
+
+def turtle_star(n, l, steps=STAR_STEPS, start=(0.0, 0.0), heading=0.0):
+    """(N, 2) vertices of the full (n, l) star the turtle scenes draw, one exact period."""
+    lengths, turns = star_block(n, l, steps)
+    return turtle_path(lengths, turns, start, heading)
@@ -0,0 +1,379 @@
+"""
+Headless stand-in for the turtle module.
+
+RecordingTurtle understands the commands the 2D scenes use (forward, left,
+right, goto, circle, color, width, pen up/down, ...) and logs every line it
+would draw into compact arrays instead of a Tk canvas. The recording is
+then rasterized with raster.draw_segments_aa and saved as a PNG, so scenes
+render on machines without a display.
+
+Run a scene headlessly with
+
+    python turtle_recorder.py module4.py module4.png
+
+which installs this module as `turtle` while the scene runs. Scenes that
+loop forever are stopped after MAX_SEGMENTS lines.
+"""
+import math
+import runpy
+import sys
+from array import array
+
+import numpy as np
+
+from raster import draw_segments_aa, world_to_pixel, write_png
+
+MAX_SEGMENTS = 2_000_000  # Scenes are stopped once they have drawn this many lines
+IMAGE_SIZE = (1600, 1200)
+
+# Named colors used by the scenes; '#rrggbb' strings and RGB tuples always work
+COLOR_NAMES = {
+    'black': (0, 0, 0), 'white': (255, 255, 255), 'red': (255, 0, 0), 'green': (0, 128, 0),
+    'lime': (0, 255, 0), 'blue': (0, 0, 255), 'yellow': (255, 255, 0), 'orange': (255, 165, 0),
+    'purple': (160, 32, 240), 'cyan': (0, 255, 255), 'magenta': (255, 0, 255), 'pink': (255, 192, 203),
+    'gray': (190, 190, 190), 'grey': (190, 190, 190), 'brown': (165, 42, 42), 'gold': (255, 215, 0),
+}
+
+class RecordingLimit(Exception):
+    """Raised when a scene exceeds MAX_SEGMENTS, to stop endless drawing loops."""
+
+class Terminator(Exception):
+    """Same name as turtle.Terminator, so scenes that catch it still import; never raised here."""
+
+# --- Recording ---
+
+class Recording:
+    """Every line drawn by every turtle, in drawing order, as compact typed arrays."""
+
+    def __init__(self, limit=MAX_SEGMENTS):
+        self.limit = limit
+        self.coords = array('d')    # x0, y0, x1, y1 per segment
+        self.color_ids = array('I')
+        self.widths = array('f')
+        self.palette = []
+        self._palette_ids = {}
+        self.background = (0, 0, 0)
+        self.colormode = 1.0
+        self.mode = 'standard'
+        self.turtles = []           # Every turtle drawing into this recording, reset on a mode change
+
+    def __len__(self):
+        return len(self.color_ids)
+
+    def color_id(self, rgb):
+        if rgb not in self._palette_ids:
+            self._palette_ids[rgb] = len(self.palette)
+            self.palette.append(rgb)
+        return self._palette_ids[rgb]
+
+    def add(self, x0, y0, x1, y1, color_id, width):
+        if len(self.color_ids) >= self.limit:
+            raise RecordingLimit(f"scene drew more than {self.limit} segments")
+        self.coords.extend((x0, y0, x1, y1))
+        self.color_ids.append(color_id)
+        self.widths.append(width)
+
+    def segments(self):
+        """(N, 2, 2) segment endpoints, (N, 3) uint8 colors and (N,) widths."""
+        coords = np.frombuffer(self.coords, dtype=float).reshape(-1, 2, 2)
+        palette = np.array(self.palette or [(0, 0, 0)], dtype=np.uint8).reshape(-1, 3)
+        colors = palette[np.frombuffer(self.color_ids, dtype=np.uint32)]
+        return coords, colors, np.frombuffer(self.widths, dtype=np.float32)
+
+    def parse_color(self, *args):
+        """RGB uint8 tuple for a turtle color argument: a name, '#rrggbb', or r, g, b in colormode."""
+        if len(args) == 1:
+            args = args[0]
+            if isinstance(args, str):
+                if args.startswith('#') and len(args) == 7:
+                    return tuple(int(args[i:i + 2], 16) for i in (1, 3, 5))
+                if args.lower() in COLOR_NAMES:
+                    return COLOR_NAMES[args.lower()]
+                raise ValueError(f"unknown color name {args!r}")
+        r, g, b = (float(value) for value in args)
+        scale = 255.0 / self.colormode
+        return tuple(int(round(min(max(value * scale, 0), 255))) for value in (r, g, b))
+
+    def render(self, size=IMAGE_SIZE, viewport=None, margin=0.05):
+        """Rasterizes the recording into an RGB image; the viewport defaults to the drawing's bounds."""
+        width, height = size
+        coords, colors, widths = self.segments()
+        if viewport is None:
+            points = coords.reshape(-1, 2) if len(coords) else np.zeros((1, 2))
+            lo, hi = points.min(axis=0), points.max(axis=0)
+            # Keep the aspect ratio of the image so circles stay round
+            span = max((hi - lo)[0] / width, (hi - lo)[1] / height, 1e-9) * (1 + 2 * margin)
+            center = (lo + hi) / 2
+            viewport = (center[0] - span * width / 2, center[1] - span * height / 2,
+                        center[0] + span * width / 2, center[1] + span * height / 2)
+        image = np.empty((height, width, 3), dtype=np.uint8)
+        image[:] = self.background
+        if len(coords):
+            pixels = world_to_pixel(coords, viewport, width, height)
+            draw_segments_aa(image, pixels[:, 0], pixels[:, 1], colors, np.maximum(widths, 1.0))
+        return image
+
+    def save(self, path, **options):
+        write_png(path, self.render(**options))
+
+recording = Recording()
+
+# --- Turtle ---
+
+class RecordingTurtle:
+    """A turtle that records its lines into `recording` instead of drawing them."""
+
+    def __init__(self, shape=None, visible=True):
+        self.recording = recording
+        recording.turtles.append(self)
+        self.reset()
+
+    def reset(self):
+        self.x, self.y = 0.0, 0.0
+        self.angle = 0.0 if self.recording.mode == 'standard' else 90.0  # Degrees, counterclockwise from east
+        self.drawing = True
+        self.pen_width = 1.0
+        self.pen_id = self.recording.color_id((0, 0, 0))
+        self.fill_rgb = (0, 0, 0)
+        self._full_circle = 360.0
+        self._poly = None
+
+    # Movement
+
+    def _move_to(self, x, y):
+        if self.drawing:
+            self.recording.add(self.x, self.y, x, y, self.pen_id, self.pen_width)
+        self.x, self.y = float(x), float(y)
+        if self._poly is not None:
+            self._poly.append((self.x, self.y))
+
+    def forward(self, distance):
+        radians = math.radians(self.angle)
+        self._move_to(self.x + distance * math.cos(radians), self.y + distance * math.sin(radians))
+
+    def back(self, distance):
+        self.forward(-distance)
+
+    def _to_degrees(self, angle):
+        return angle * 360.0 / self._full_circle
+
+    def left(self, angle):
+        self.angle = (self.angle + self._to_degrees(angle)) % 360.0
+
+    def right(self, angle):
+        self.left(-angle)
+
+    def goto(self, x, y=None):
+        if y is None:
+            x, y = x
+        self._move_to(x, y)
+
+    def setx(self, x):
+        self._move_to(x, self.y)
+
+    def sety(self, y):
+        self._move_to(self.x, y)
+
+    def setheading(self, to_angle):
+        degrees = self._to_degrees(to_angle)
+        self.angle = (degrees if self.recording.mode == 'standard' else 90.0 - degrees) % 360.0
+
+    def heading(self):
+        degrees = self.angle if self.recording.mode == 'standard' else (90.0 - self.angle) % 360.0
+        return degrees * self._full_circle / 360.0
+
+    def home(self):
+        self.goto(0, 0)
+        self.setheading(0)
+
+    def circle(self, radius, extent=None, steps=None):
+        """Draws an arc as a polygon, with the same step count and chords as turtle.circle."""
+        if extent is None:
+            extent = self._full_circle
+        if steps is None:
+            fraction = abs(extent) / self._full_circle
+            steps = 1 + int(min(11 + abs(radius) / 6.0, 59.0) * fraction)
+        w = 1.0 * extent / steps
+        w2 = 0.5 * w
+        length = 2.0 * radius * math.sin(math.radians(self._to_degrees(w2)))
+        if radius < 0:
+            length, w, w2 = -length, -w, -w2
+        self.left(w2)
+        for i in range(steps):
+            self.forward(length)
+            self.left(w)
+        self.left(-w2)
+
+    def position(self):
+        return (self.x, self.y)
+
+    def xcor(self):
+        return self.x
+
+    def ycor(self):
+        return self.y
+
+    def degrees(self, fullcircle=360.0):
+        self._full_circle = fullcircle
+
+    def radians(self):
+        self._full_circle = 2 * math.pi
+
+    # Pen
+
+    def penup(self):
+        self.drawing = False
+
+    def pendown(self):
+        self.drawing = True
+
+    def isdown(self):
+        return self.drawing
+
+    def width(self, width=None):
+        if width is None:
+            return self.pen_width
+        self.pen_width = float(width)
+
+    def pencolor(self, *args):
+        if args:
+            self.pen_id = self.recording.color_id(self.recording.parse_color(*args))
+
+    def fillcolor(self, *args):
+        if args:
+            self.fill_rgb = self.recording.parse_color(*args)
+
+    def color(self, *args):
+        if len(args) == 2:
+            self.pencolor(args[0])
+            self.fillcolor(args[1])
+        elif args:
+            self.pencolor(*args)
+            self.fillcolor(*args)
+
+    def dot(self, size=None, *color):
+        """Records a dot as a zero-length stroke of the dot's diameter, which round caps draw as a disc."""
+        size = max(self.pen_width + 4, 2 * self.pen_width) if size is None else size
+        color_id = self.recording.color_id(self.recording.parse_color(*color)) if color else self.pen_id
+        self.recording.add(self.x, self.y, self.x, self.y, color_id, float(size))
+
+    def begin_poly(self):
+        self._poly = [(self.x, self.y)]
+
+    def end_poly(self):
+        self._last_poly, self._poly = tuple(self._poly or ()), None
+
+    def get_poly(self):
+        return getattr(self, '_last_poly', ())
+
+    # Commands with nothing to record
+    def _ignore(self, *args, **kwargs):
+        pass
+
+    speed = hideturtle = showturtle = begin_fill = end_fill = write = clear = shape = _ignore
+    shapesize = resizemode = stamp = _ignore
+    fd, bk, backward, lt, rt = forward, back, back, left, right
+    setpos = setposition = goto
+    seth = setheading
+    pos = position
+    pu = up = penup
+    pd = down = pendown
+    pensize = width
+    ht = hideturtle
+    st = showturtle
+
+# --- Screen ---
+
+class RecordingScreen:
+    """Screen settings that matter headlessly; everything else is accepted and ignored."""
+
+    def bgcolor(self, *args):
+        if args:
+            recording.background = recording.parse_color(*args)
+
+    def colormode(self, mode=None):
+        if mode is None:
+            return recording.colormode
+        recording.colormode = float(mode)
+
+    def mode(self, mode=None):
+        if mode is None:
+            return recording.mode
+        recording.mode = mode
+        # Like turtle, a mode change resets every turtle, so logo-mode turtles face north
+        for drawer in recording.turtles:
+            drawer.reset()
+
+    def _ignore(self, *args, **kwargs):
+        pass
+
+    setup = screensize = title = tracer = delay = update = exitonclick = mainloop = done = bye = _ignore
+    ontimer = register_shape = addshape = _ignore
+
+_screen = RecordingScreen()
+_default = None
+
+def Screen():
+    return _screen
+
+Turtle = Pen = RawTurtle = RecordingTurtle
+
+def _turtle():
+    global _default
+    if _default is None:
+        _default = RecordingTurtle()
+    return _default
+
+def getturtle():
+    return _turtle()
+
+getpen = getturtle
+
+def _delegate(name):
+    def command(*args, **kwargs):
+        return getattr(_turtle(), name)(*args, **kwargs)
+    command.__name__ = name
+    return command
+
+_TURTLE_COMMANDS = ['forward', 'fd', 'back', 'bk', 'backward', 'left', 'lt', 'right', 'rt', 'goto', 'setpos',
+                    'setposition', 'setx', 'sety', 'setheading', 'seth', 'heading', 'home', 'circle',
+                    'position', 'pos', 'xcor', 'ycor', 'degrees', 'radians', 'penup', 'pu', 'up', 'pendown',
+                    'pd', 'down', 'isdown', 'width', 'pensize', 'pencolor', 'fillcolor', 'color', 'dot',
+                    'speed', 'hideturtle', 'ht', 'showturtle', 'st', 'begin_fill', 'end_fill', 'write',
+                    'clear', 'shape', 'shapesize', 'resizemode', 'stamp', 'begin_poly', 'end_poly',
+                    'get_poly', 'reset']
+_SCREEN_COMMANDS = ['bgcolor', 'colormode', 'mode', 'setup', 'screensize', 'title', 'tracer', 'update',
+                    'exitonclick', 'mainloop', 'done', 'bye', 'ontimer', 'register_shape', 'addshape', 'delay']
+
+for _name in _TURTLE_COMMANDS:
+    globals()[_name] = _delegate(_name)
+for _name in _SCREEN_COMMANDS:
+    globals()[_name] = getattr(_screen, _name)
+
+__all__ = ['Screen', 'Turtle', 'Pen', 'RawTurtle', 'Terminator', 'getturtle', 'getpen'] + _TURTLE_COMMANDS + _SCREEN_COMMANDS
+
+# --- Headless Runner ---
+
+def record_script(path, limit=MAX_SEGMENTS):
+    """Runs a turtle scene with this module standing in for turtle and returns its Recording."""
+    global recording, _default
+    recording = Recording(limit)
+    _default = None
+    real_turtle = sys.modules.get('turtle')
+    sys.modules['turtle'] = sys.modules[__name__]
+    try:
+        runpy.run_path(path, run_name='__main__')
+    except RecordingLimit:
+        pass
+    finally:
+        if real_turtle is None:
+            del sys.modules['turtle']
+        else:
+            sys.modules['turtle'] = real_turtle
+    return recording
+
+if __name__ == '__main__':
+    scene, output = sys.argv[1], sys.argv[2]
+    result = record_script(scene)
+    result.save(output)
+    print(f"Rendered {len(result)} segments from {scene} to {output}")
@@ -8,6 +8,10 @@ import turtle
 from turtle import *
 from datetime import datetime
 import colorsys
+
+from frame_batch import FrameBatch
+from recurrences import fibonacci
+
 # taking input for the number of the sides of the polygon 
 n = 17
 # taking input for the length of the sides of the polygon 
@@ -35,16 +39,6 @@ colors = [
 (0.00, 0.00, 1.00),(0.05, 0.00, 1.00),(0.10, 0.00, 1.00),(0.15, 0.00, 1.00),(0.20, 0.00, 1.00),(0.25, 0.00, 1.00),(0.30, 0.00, 1.00),(0.35, 0.00, 1.00),(0.40, 0.00, 1.00),(0.45, 0.00, 1.00),(0.50, 0.00, 1.00),(0.55, 0.00, 1.00),(0.60, 0.00, 1.00),(0.65, 0.00, 1.00),(0.70, 0.00, 1.00),(0.75, 0.00, 1.00),(0.80, 0.00, 1.00),(0.85, 0.00, 1.00),(0.90, 0.00, 1.00),(0.95, 0.00, 1.00)
 ]
 
-memo = {}
-def fibonacci(n):
-    if n in memo : 
-        return memo[n]
-    if n <= 2: 
-        f = 1
-    else: f = fibonacci(n-1) + fibonacci(n-2)
-    memo[n] = f 
-    return f
-
 def jump(distanz, winkel=0):
     penup()
     right(winkel)
@@ -180,7 +174,8 @@ def main():
     setup()
     tracer(True)
     tick()
-    star(fibonacci)  
+    with FrameBatch(wn, skk):
+        star(fibonacci)  
     return "EVENTLOOP"
 
 while __name__ == "__main__":